@@ -0,0 +1,265 @@
+import argparse
+import gc
+import importlib.util
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.normpath(os.path.join(SCRIPT_DIR, "../.."))
+DEFAULT_SOURCE = os.path.join(REPO_ROOT, "app/src/assets/map.json")
+DEFAULT_SCALES = "1,10,100"
+STAGES = [
+    "walk_map",
+    "build_export",
+    "reconstruct_map",
+    "merge_references",
+    "normalize_map_path",
+    "normalize_payload",
+    "stability_check",
+]
+
+
+def load_json(path):
+    with open(path, "r", encoding="utf-8") as file:
+        return json.load(file)
+
+
+def load_map_tx_module():
+    module_path = os.path.join(SCRIPT_DIR, "map_tx.py")
+    spec = importlib.util.spec_from_file_location("quran_tft_map_tx", module_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def synthetic_reference(rng):
+    parts = []
+    for _ in range(rng.choice((1, 1, 1, 2, 3))):
+        chapter = rng.randint(1, 114)
+        verse = rng.randint(1, 286)
+        if rng.random() < 0.3:
+            parts.append(f"{chapter}:{verse}-{verse + rng.randint(1, 12)}")
+        else:
+            parts.append(f"{chapter}:{verse}")
+    return "; ".join(parts)
+
+
+def set_path(root, path, reference):
+    current = root
+    for part in path[:-1]:
+        existing = current.get(part)
+        if not isinstance(existing, dict):
+            existing = current[part] = {}
+        current = existing
+    current[path[-1]] = reference
+
+
+def generate_map(map_tx, source_data, scale, duplicate_ratio, seed):
+    """
+    Build a synthetic map with the source map's shape repeated scale times.
+
+    Copies after the first get a numbered second-level heading, so paths stay
+    unique and top-level roots stay single letters. Each leaf reuses an earlier
+    reference with probability duplicate_ratio and gets a new synthetic
+    reference otherwise.
+    """
+    rng = random.Random(f"{seed}:{scale}:{duplicate_ratio}")
+    generated = {}
+    references = []
+    for copy_index in range(scale):
+        for path, _reference in map_tx.walk_map(source_data):
+            if copy_index and len(path) > 1:
+                path = (path[0], f"{path[1]} ({copy_index + 1})") + path[2:]
+            elif copy_index:
+                path = (path[0], f"({copy_index + 1})")
+            if references and rng.random() < duplicate_ratio:
+                reference = rng.choice(references)
+            else:
+                reference = synthetic_reference(rng)
+                references.append(reference)
+            set_path(generated, path, reference)
+    return generated
+
+
+def run_stage(map_tx, stage, data, flat, manifest):
+    if stage == "walk_map":
+        for _item in map_tx.walk_map(data):
+            pass
+    elif stage == "build_export":
+        map_tx.build_export(data, "synthetic.json")
+    elif stage == "reconstruct_map":
+        map_tx.reconstruct_map(flat, manifest)
+    elif stage == "merge_references":
+        for items in map_tx.group_items_by_reference(manifest).values():
+            map_tx.merge_references(*(item["reference"] for item in items))
+    elif stage == "normalize_map_path":
+        for value in flat.values():
+            map_tx.normalize_map_path(value.split("\n"))
+    elif stage == "normalize_payload":
+        map_tx.normalize_payload(flat)
+    elif stage == "stability_check":
+        map_tx.check_key_stability(data, manifest, "synthetic.json")
+    else:
+        raise ValueError(f"Unknown stage: {stage}")
+
+
+def clear_caches(map_tx):
+    """Empty the map_tx memo caches so every run starts cold and scales stay comparable."""
+    map_tx.path_digest.cache_clear()
+    map_tx.parse_references.cache_clear()
+    map_tx.parse_reference_part.cache_clear()
+    map_tx.normalize_map_value.cache_clear()
+
+
+def time_stage(map_tx, stage, data, flat, manifest, repeat):
+    timings = []
+    for _ in range(repeat):
+        clear_caches(map_tx)
+        gc.collect()
+        started = time.perf_counter()
+        run_stage(map_tx, stage, data, flat, manifest)
+        timings.append(time.perf_counter() - started)
+
+    # Peak memory comes from a separate traced run so tracing does not skew timings.
+    clear_caches(map_tx)
+    gc.collect()
+    tracemalloc.start()
+    run_stage(map_tx, stage, data, flat, manifest)
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "runs": repeat,
+        "min_seconds": min(timings),
+        "median_seconds": statistics.median(timings),
+        "max_seconds": max(timings),
+        "peak_memory_bytes": peak,
+    }
+
+
+def bench_case(map_tx, source_data, scale, duplicate_ratio, seed, repeat, stages):
+    data = generate_map(map_tx, source_data, scale, duplicate_ratio, seed)
+    flat, manifest = map_tx.build_export(data, "synthetic.json")
+    duplicate_groups = [
+        items
+        for items in map_tx.group_items_by_reference(manifest).values()
+        if len(items) > 1
+    ]
+    case = {
+        "scale": scale,
+        "duplicate_ratio": duplicate_ratio,
+        "leaf_count": len(manifest["items"]),
+        "duplicate_reference_groups": len(duplicate_groups),
+        "duplicate_reference_entries": sum(len(items) for items in duplicate_groups),
+        "stages": {},
+    }
+    for stage in stages:
+        case["stages"][stage] = time_stage(map_tx, stage, data, flat, manifest, repeat)
+        print(
+            f"scale {scale:>4} dup {duplicate_ratio:.2f} {stage:<20} "
+            f"median {case['stages'][stage]['median_seconds'] * 1000:10.1f} ms  "
+            f"peak {case['stages'][stage]['peak_memory_bytes'] / 1024 / 1024:8.1f} MiB"
+        )
+    return case
+
+
+def parse_number_list(value, cast):
+    try:
+        return [cast(part) for part in value.split(",") if part.strip()]
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc)) from exc
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description=(
+            "Benchmark the map_tx stable-key engine on synthetic maps shaped like "
+            "app/src/assets/map.json."
+        ),
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""examples:
+  # Default run: 1x, 10x and 100x the source map, results printed and saved as JSON.
+  %(prog)s --out scrapper/map-work/out/bench-map-tx.json
+
+  # Quick check of the export and stability stages only.
+  %(prog)s --scales 1,10 --stages build_export,stability_check --repeat 3
+
+  # Heavier duplicate-reference density.
+  %(prog)s --duplicate-ratios 0.1,0.5
+""",
+    )
+    parser.add_argument("--source", default=DEFAULT_SOURCE, help=f"Map whose shape is replicated. Default: {DEFAULT_SOURCE}")
+    parser.add_argument(
+        "--scales",
+        type=lambda value: parse_number_list(value, int),
+        default=parse_number_list(DEFAULT_SCALES, int),
+        help=f"Comma-separated size multipliers of the source map. Default: {DEFAULT_SCALES}",
+    )
+    parser.add_argument(
+        "--duplicate-ratios",
+        type=lambda value: parse_number_list(value, float),
+        default=[0.1],
+        help="Comma-separated probabilities that a leaf reuses an earlier reference. Default: 0.1",
+    )
+    parser.add_argument(
+        "--stages",
+        type=lambda value: parse_number_list(value, str),
+        default=list(STAGES),
+        help=f"Comma-separated stages to run. Default: {','.join(STAGES)}",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per stage. Default: 5.")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed for synthetic references. Default: 1.")
+    parser.add_argument("--out", help="Write machine-readable results to this JSON file.")
+    return parser
+
+
+def main():
+    parser = build_parser()
+    args = parser.parse_args()
+    unknown_stages = [stage for stage in args.stages if stage not in STAGES]
+    if unknown_stages:
+        parser.error(f"Unknown stage(s): {', '.join(unknown_stages)}. Available: {', '.join(STAGES)}")
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+    if any(scale < 1 for scale in args.scales):
+        parser.error("--scales must be positive")
+    if any(not 0 <= ratio < 1 for ratio in args.duplicate_ratios):
+        parser.error("--duplicate-ratios must be in [0, 1)")
+
+    map_tx = load_map_tx_module()
+    source_data = load_json(args.source)
+    results = {
+        "kind": "quran-tft-map-tx-benchmark",
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "source": os.path.normpath(args.source),
+        "seed": args.seed,
+        "repeat": args.repeat,
+        "cases": [],
+    }
+    for duplicate_ratio in args.duplicate_ratios:
+        for scale in args.scales:
+            results["cases"].append(
+                bench_case(map_tx, source_data, scale, duplicate_ratio, args.seed, args.repeat, args.stages)
+            )
+
+    if args.out:
+        os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+        with open(args.out, "w", encoding="utf-8") as file:
+            json.dump(results, file, ensure_ascii=False, indent=4)
+            file.write("\n")
+        print(f"\nResults: {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,14 +1,40 @@
 import argparse
-import copy
+import bisect
 import csv
+import functools
+import glob
 import hashlib
 import json
+import mmap
 import os
 import re
+import struct
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import NamedTuple
 
 
 DEFAULT_HASH_LENGTH = 40
 INVISIBLE_BLANK_CHARS = "\u200b\u200c\u200d\ufeff"
+NORMALIZED_VALUE_CACHE_SIZE = 1 << 18
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_MANIFEST = os.path.join(SCRIPT_DIR, "map_tx_manifest.json")
+PATH_HASH_CACHE_FILENAME = ".map_tx_path_hashes.json"
+PATH_HASH_CACHE_SIZE = 65536
+REFERENCE_PARSE_CACHE_SIZE = 65536
+REFERENCE_PART_RE = re.compile(r"(\d+)(?::(\d+))?")
+LEGACY_INDEX_CACHE_DIRNAME = ".map_tx_legacy_index"
+LEGACY_INDEX_KIND = "quran-tft-map-tx-legacy-index"
+MANIFEST_KIND = "quran-tft-map-tx-manifest"
+BINARY_MANIFEST_MAGIC = b"QTFMTXB1"
+BINARY_MANIFEST_HEADER = struct.Struct("<8sIIIII")
+BINARY_MANIFEST_ITEM = struct.Struct("<IIII")
+BINARY_MANIFEST_U32 = struct.Struct("<I")
+WRITE_BUFFER_SIZE = 1 << 20
+REPORT_WRITER_THREADS = 4
+BATCH_LANG_PATTERN = r"^(?:map_)?(?P<lang>[a-z]{2,3}(?:[-_][A-Z][A-Za-z0-9]*)?)(?=[_.])"
+_persisted_path_digests = None
+_persisted_path_digests_changed = False
+_BATCH_WORKER_STATE = {}
 
 
 def load_json(path):
@@ -17,32 +43,122 @@ def load_json(path):
 
 
 def write_json(path, data, sort_keys=False):
-    with open(path, "w", encoding="utf-8") as file:
+    with open(path, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as file:
         json.dump(data, file, ensure_ascii=False, indent=4, sort_keys=sort_keys)
         file.write("\n")
 
 
-def walk_map(data, path=None):
-    if path is None:
-        path = []
+def walk_map(data, path=()):
+    """
+    Yield (path, reference) for every leaf in document order.
 
-    if isinstance(data, dict):
-        for key, value in data.items():
-            yield from walk_map(value, path + [key])
-    elif isinstance(data, str):
+    Paths are tuples built once per node with an explicit stack, so callers can
+    keep or hash them without copying.
+    """
+    path = tuple(path)
+    if isinstance(data, str):
         yield path, data
-    else:
+        return
+    if not isinstance(data, dict):
         raise TypeError(f"Unsupported map value at {' > '.join(path)}: {type(data).__name__}")
 
+    stack = [(path, iter(data.items()))]
+    while stack:
+        prefix, entries = stack[-1]
+        for key, value in entries:
+            child_path = prefix + (key,)
+            if isinstance(value, dict):
+                stack.append((child_path, iter(value.items())))
+                break
+            if not isinstance(value, str):
+                raise TypeError(f"Unsupported map value at {' > '.join(child_path)}: {type(value).__name__}")
+            yield child_path, value
+        else:
+            stack.pop()
+
+
+def flatten_map(data):
+    """Flatten a nested map into parallel (paths, references) lists; the index is the path id."""
+    paths = []
+    references = []
+    for path, reference in walk_map(data):
+        paths.append(path)
+        references.append(reference)
+    return paths, references
+
+
+@functools.lru_cache(maxsize=PATH_HASH_CACHE_SIZE)
+def path_digest(path):
+    """Full SHA-1 hex digest of a path tuple, memoized and optionally persisted."""
+    global _persisted_path_digests_changed
+    if _persisted_path_digests is not None:
+        digest = _persisted_path_digests.get(path)
+        if digest is not None:
+            return digest
 
-def stable_path_id(path, hash_length=DEFAULT_HASH_LENGTH):
     canonical_path = json.dumps(path, ensure_ascii=False, separators=(",", ":"))
-    return hashlib.sha1(canonical_path.encode("utf-8")).hexdigest()[:hash_length]
+    digest = hashlib.sha1(canonical_path.encode("utf-8")).hexdigest()
+    if _persisted_path_digests is not None:
+        _persisted_path_digests[path] = digest
+        _persisted_path_digests_changed = True
+    return digest
+
+
+def stable_path_id(path, hash_length=DEFAULT_HASH_LENGTH):
+    return path_digest(tuple(path))[:hash_length]
+
+
+def path_hash_cache_path_for(manifest_path):
+    return os.path.join(os.path.dirname(os.path.abspath(manifest_path)), PATH_HASH_CACHE_FILENAME)
+
+
+def load_path_hash_cache(cache_path):
+    """
+    Use cache_path as a persistent path hash store for the rest of the process.
+
+    Entries map a source path to the full SHA-1 of its canonical JSON form, so
+    they never go stale; an unreadable file just starts an empty cache.
+    """
+    global _persisted_path_digests, _persisted_path_digests_changed
+    entries = {}
+    if os.path.exists(cache_path):
+        try:
+            stored = load_json(cache_path)
+        except (OSError, ValueError) as exc:
+            print(f"Ignoring unreadable path hash cache {cache_path}: {exc}")
+            stored = {}
+        if stored.get("version") == 1:
+            entries = {tuple(path): digest for path, digest in stored.get("entries", [])}
+    _persisted_path_digests = entries
+    _persisted_path_digests_changed = False
+    path_digest.cache_clear()
+
+
+def save_path_hash_cache(cache_path):
+    global _persisted_path_digests_changed
+    if _persisted_path_digests is None or not _persisted_path_digests_changed:
+        return
+    os.makedirs(os.path.dirname(os.path.abspath(cache_path)), exist_ok=True)
+    with open(cache_path, "w", encoding="utf-8") as file:
+        json.dump(
+            {
+                "version": 1,
+                "entries": [[list(path), digest] for path, digest in _persisted_path_digests.items()],
+            },
+            file,
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+        file.write("\n")
+    _persisted_path_digests_changed = False
+
+
+def readable_reference(reference):
+    return reference.strip() or "empty"
 
 
 def make_tx_key(path, reference, hash_length=DEFAULT_HASH_LENGTH):
-    readable_reference = reference.strip() or "empty"
-    return f"{readable_reference}__{stable_path_id(path, hash_length)}"
+    return f"{readable_reference(reference)}__{stable_path_id(path, hash_length)}"
 
 
 def build_export(map_data, source_path, hash_length=DEFAULT_HASH_LENGTH):
@@ -50,13 +166,14 @@ def build_export(map_data, source_path, hash_length=DEFAULT_HASH_LENGTH):
     items = []
     seen_keys = {}
 
-    for order, (path, reference) in enumerate(walk_map(map_data)):
+    paths, references = flatten_map(map_data)
+    for order, (path, reference) in enumerate(zip(paths, references)):
         tx_key = make_tx_key(path, reference, hash_length)
         previous_path = seen_keys.get(tx_key)
         if previous_path is not None and previous_path != path:
             raise ValueError(
                 "Transifex key collision. Increase HASH_LENGTH before exporting: "
-                f"{tx_key} maps to both {previous_path!r} and {path!r}"
+                f"{tx_key} maps to both {list(previous_path)!r} and {list(path)!r}"
             )
         seen_keys[tx_key] = path
 
@@ -64,13 +181,13 @@ def build_export(map_data, source_path, hash_length=DEFAULT_HASH_LENGTH):
         items.append({
             "key": tx_key,
             "order": order,
-            "source_path": path,
+            "source_path": list(path),
             "reference": reference,
         })
 
     manifest = {
         "version": 1,
-        "kind": "quran-tft-map-tx-manifest",
+        "kind": MANIFEST_KIND,
         "generated_by": "map_tx.py export",
         "source": os.path.normpath(source_path),
         "hash_length": hash_length,
@@ -80,29 +197,320 @@ def build_export(map_data, source_path, hash_length=DEFAULT_HASH_LENGTH):
     return flat, manifest
 
 
-def parse_reference_sort_key(reference):
+def split_tx_key(tx_key):
+    readable, separator, path_hash = tx_key.rpartition("__")
+    if not separator:
+        return None, None
+    return readable, path_hash
+
+
+def encode_binary_manifest(manifest):
+    """
+    Encode a manifest in the compact binary form.
+
+    Layout, all integers little-endian u32:
+      header   magic, hash_length, item_count, string_count, path_id_count, meta_length
+      meta     JSON object with the manifest's top-level fields except items
+      strings  string_count + 1 offsets into a UTF-8 blob, then the blob;
+               path segments and references are interned here
+      items    (order, reference string id, first path id, path length), in order
+      path ids string ids of every item's source path, concatenated
+      hashes   (path hash as hash_length ASCII bytes, item index), sorted by hash
+
+    Keys are not stored: every key must be <readable reference>__<path hash>,
+    which is what build_export() writes.
+    """
+    hash_length = manifest["hash_length"]
+    strings = []
+    string_ids = {}
+
+    def intern(value):
+        string_id = string_ids.get(value)
+        if string_id is None:
+            string_id = string_ids[value] = len(strings)
+            strings.append(value)
+        return string_id
+
+    item_records = []
+    path_ids = []
+    hash_entries = []
+    for index, item in enumerate(manifest["items"]):
+        readable, path_hash = split_tx_key(item["key"])
+        if readable != readable_reference(item["reference"]) or path_hash is None or len(path_hash) != hash_length:
+            raise ValueError(f"Manifest key {item['key']!r} is not <reference>__<path hash>; keep the JSON manifest")
+        item_records.append(BINARY_MANIFEST_ITEM.pack(
+            item["order"],
+            intern(item["reference"]),
+            len(path_ids),
+            len(item["source_path"]),
+        ))
+        path_ids.extend(intern(part) for part in item["source_path"])
+        hash_entries.append((path_hash.encode("ascii"), index))
+    hash_entries.sort()
+    if any(left[0] == right[0] for left, right in zip(hash_entries, hash_entries[1:])):
+        raise ValueError("Duplicate path hashes in manifest; increase --hash-length before exporting")
+
+    encoded_strings = [value.encode("utf-8") for value in strings]
+    offsets = [0]
+    for encoded in encoded_strings:
+        offsets.append(offsets[-1] + len(encoded))
+    meta = {key: value for key, value in manifest.items() if key != "items"}
+    meta_bytes = json.dumps(meta, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    return b"".join([
+        BINARY_MANIFEST_HEADER.pack(
+            BINARY_MANIFEST_MAGIC,
+            hash_length,
+            len(item_records),
+            len(strings),
+            len(path_ids),
+            len(meta_bytes),
+        ),
+        meta_bytes,
+        struct.pack(f"<{len(offsets)}I", *offsets),
+        b"".join(encoded_strings),
+        b"".join(item_records),
+        struct.pack(f"<{len(path_ids)}I", *path_ids),
+        b"".join(path_hash + BINARY_MANIFEST_U32.pack(index) for path_hash, index in hash_entries),
+    ])
+
+
+def write_binary_manifest(path, manifest):
+    with open(path, "wb") as file:
+        file.write(encode_binary_manifest(manifest))
+
+
+class BinaryManifest:
+    """
+    Read-only view of a binary manifest. Single-key lookups binary-search the
+    memory-mapped hash table and decode only the matching item.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as file:
+            self.buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        (
+            magic,
+            self.hash_length,
+            self.item_count,
+            self.string_count,
+            path_id_count,
+            meta_length,
+        ) = BINARY_MANIFEST_HEADER.unpack_from(self.buffer, 0)
+        if magic != BINARY_MANIFEST_MAGIC:
+            self.buffer.close()
+            raise ValueError(f"{path} is not a binary map manifest")
+
+        offset = BINARY_MANIFEST_HEADER.size
+        self.meta = json.loads(self.buffer[offset:offset + meta_length].decode("utf-8"))
+        offset += meta_length
+        self.string_offsets_at = offset
+        offset += (self.string_count + 1) * BINARY_MANIFEST_U32.size
+        self.strings_at = offset
+        offset += self._u32(self.string_offsets_at + self.string_count * BINARY_MANIFEST_U32.size)
+        self.items_at = offset
+        offset += self.item_count * BINARY_MANIFEST_ITEM.size
+        self.path_ids_at = offset
+        offset += path_id_count * BINARY_MANIFEST_U32.size
+        self.hashes_at = offset
+        self.hash_entry_size = self.hash_length + BINARY_MANIFEST_U32.size
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.buffer.close()
+
+    def _u32(self, offset):
+        return BINARY_MANIFEST_U32.unpack_from(self.buffer, offset)[0]
+
+    def string(self, string_id):
+        start, end = struct.unpack_from("<II", self.buffer, self.string_offsets_at + string_id * BINARY_MANIFEST_U32.size)
+        return self.buffer[self.strings_at + start:self.strings_at + end].decode("utf-8")
+
+    def hash_entry(self, position):
+        offset = self.hashes_at + position * self.hash_entry_size
+        path_hash = self.buffer[offset:offset + self.hash_length]
+        return path_hash, self._u32(offset + self.hash_length)
+
+    def item(self, index, path_hash=None):
+        order, reference_id, path_start, path_length = BINARY_MANIFEST_ITEM.unpack_from(
+            self.buffer,
+            self.items_at + index * BINARY_MANIFEST_ITEM.size,
+        )
+        path_ids = struct.unpack_from(
+            f"<{path_length}I",
+            self.buffer,
+            self.path_ids_at + path_start * BINARY_MANIFEST_U32.size,
+        )
+        reference = self.string(reference_id)
+        return {
+            "key": f"{readable_reference(reference)}__{path_hash}",
+            "order": order,
+            "source_path": [self.string(string_id) for string_id in path_ids],
+            "reference": reference,
+        }
+
+    def lookup(self, tx_key):
+        """Return the manifest item for tx_key, or None."""
+        readable, path_hash = split_tx_key(tx_key)
+        if path_hash is None or len(path_hash) != self.hash_length:
+            return None
+        try:
+            wanted = path_hash.encode("ascii")
+        except UnicodeEncodeError:
+            return None
+        low, high = 0, self.item_count
+        while low < high:
+            middle = (low + high) // 2
+            if self.hash_entry(middle)[0] < wanted:
+                low = middle + 1
+            else:
+                high = middle
+        if low == self.item_count:
+            return None
+        found_hash, index = self.hash_entry(low)
+        if found_hash != wanted:
+            return None
+        item = self.item(index, path_hash)
+        return item if item["key"] == tx_key else None
+
+    def to_manifest(self):
+        offsets = struct.unpack_from(f"<{self.string_count + 1}I", self.buffer, self.string_offsets_at)
+        blob = self.buffer[self.strings_at:self.items_at]
+        strings = [blob[start:end].decode("utf-8") for start, end in zip(offsets, offsets[1:])]
+
+        path_hashes = [None] * self.item_count
+        hash_table = self.buffer[self.hashes_at:self.hashes_at + self.item_count * self.hash_entry_size]
+        for offset in range(0, len(hash_table), self.hash_entry_size):
+            index = BINARY_MANIFEST_U32.unpack_from(hash_table, offset + self.hash_length)[0]
+            path_hashes[index] = hash_table[offset:offset + self.hash_length].decode("ascii")
+
+        path_ids = struct.unpack_from(
+            f"<{(self.hashes_at - self.path_ids_at) // BINARY_MANIFEST_U32.size}I",
+            self.buffer,
+            self.path_ids_at,
+        )
+        path_strings = [strings[string_id] for string_id in path_ids]
+        items = []
+        for index, (order, reference_id, path_start, path_length) in enumerate(
+            BINARY_MANIFEST_ITEM.iter_unpack(self.buffer[self.items_at:self.path_ids_at])
+        ):
+            reference = strings[reference_id]
+            items.append({
+                "key": f"{readable_reference(reference)}__{path_hashes[index]}",
+                "order": order,
+                "source_path": path_strings[path_start:path_start + path_length],
+                "reference": reference,
+            })
+
+        manifest = dict(self.meta)
+        manifest["items"] = items
+        return manifest
+
+
+def is_binary_manifest(path):
+    with open(path, "rb") as file:
+        return file.read(len(BINARY_MANIFEST_MAGIC)) == BINARY_MANIFEST_MAGIC
+
+
+def load_manifest(path):
+    """Load a manifest from its JSON or binary form."""
+    if is_binary_manifest(path):
+        with BinaryManifest(path) as binary_manifest:
+            return binary_manifest.to_manifest()
+    return load_json(path)
+
+
+class ManifestIndex:
+    """
+    Lookup tables over one manifest, built once and shared by every language
+    that is checked or reconstructed against it.
+    """
+
+    def __init__(self, manifest):
+        items = manifest.get("items", [])
+        if not isinstance(items, list):
+            raise ValueError("Manifest must contain an items list")
+
+        self.manifest = manifest
+        self.items = sorted(items, key=lambda entry: entry["order"])
+        self.keys_in_order = [item["key"] for item in self.items]
+        self.paths_in_order = [tuple(item["source_path"]) for item in self.items]
+        self.keys = frozenset(self.keys_in_order)
+        self.item_by_key = {item["key"]: item for item in self.items}
+        self.key_by_path = dict(zip(self.paths_in_order, self.keys_in_order))
+        self.key_by_hash = {}
+        self.duplicate_hashes = []
+        for tx_key in self.keys_in_order:
+            _, path_hash = split_tx_key(tx_key)
+            if path_hash in self.key_by_hash:
+                self.duplicate_hashes.append(path_hash)
+            self.key_by_hash[path_hash] = tx_key
+
+    def __len__(self):
+        return len(self.items)
+
+
+class ReferencePart(NamedTuple):
+    """One ';'-separated part of a reference; tuple order is the merge sort order."""
+
+    chapter: float
+    verse: float
+    text: str
+
+
+@functools.lru_cache(maxsize=REFERENCE_PARSE_CACHE_SIZE)
+def parse_reference_part(reference):
     reference = reference.strip()
-    match = re.match(r"(\d+)(?::(\d+))?", reference)
+    match = REFERENCE_PART_RE.match(reference)
     if not match:
-        return (float("inf"), float("inf"), reference)
+        return ReferencePart(float("inf"), float("inf"), reference)
     chapter = int(match.group(1))
     verse = int(match.group(2)) if match.group(2) else 0
-    return (chapter, verse, reference)
+    return ReferencePart(chapter, verse, reference)
+
+
+@functools.lru_cache(maxsize=REFERENCE_PARSE_CACHE_SIZE)
+def parse_references(reference):
+    """Sorted, de-duplicated ReferenceParts of a reference string."""
+    return tuple(sorted({parse_reference_part(part) for part in split_references(reference)}))
 
 
 def split_references(reference):
     return [part.strip() for part in reference.split(";") if part.strip()]
 
 
+class MergedReference:
+    """
+    Reference parts of one map leaf, kept sorted and de-duplicated while
+    colliding leaves are merged into it. str() gives the merged reference.
+    """
+
+    __slots__ = ("parts", "texts")
+
+    def __init__(self, *references):
+        self.parts = []
+        self.texts = set()
+        for reference in references:
+            self.add(reference)
+
+    def add(self, reference):
+        for part in parse_references(reference):
+            if part.text not in self.texts:
+                self.texts.add(part.text)
+                bisect.insort(self.parts, part)
+
+    def __str__(self):
+        return "; ".join(part.text for part in self.parts)
+
+
 def merge_references(*references):
-    seen = set()
-    parts = []
-    for reference in references:
-        for part in split_references(reference):
-            if part not in seen:
-                seen.add(part)
-                parts.append(part)
-    return "; ".join(sorted(parts, key=parse_reference_sort_key))
+    return str(MergedReference(*references))
 
 
 def translated_path_for(item, flat_data, fallback_to_source):
@@ -117,7 +525,7 @@ def translated_path_for(item, flat_data, fallback_to_source):
     if not isinstance(value, str):
         raise TypeError(f"Translation value for {tx_key} must be a string")
 
-    levels, _ = normalize_map_path(value.split("\n"))
+    levels = normalize_map_value(value).levels
     if not levels:
         if not fallback_to_source:
             raise ValueError(f"Translation value for {tx_key} has no path segments")
@@ -125,7 +533,15 @@ def translated_path_for(item, flat_data, fallback_to_source):
     return levels
 
 
-def set_leaf(root, path, reference):
+def set_leaf(root, path, reference, merges=None):
+    """
+    Set or merge the reference at path. Returns True when a new leaf was created.
+
+    When a merges list is given, merged leaves are left in the tree as
+    MergedReference objects (also appended to merges) so repeated collisions on
+    one leaf insert parts instead of re-merging strings; call
+    render_merged_references on the tree afterwards.
+    """
     current = root
     for index, part in enumerate(path):
         is_last = index == len(path) - 1
@@ -134,11 +550,13 @@ def set_leaf(root, path, reference):
             existing = current.get(part)
             if existing is None:
                 current[part] = reference
-            elif isinstance(existing, dict):
-                existing[""] = merge_references(existing.get("", ""), reference)
-            else:
-                current[part] = merge_references(existing, reference)
-            return
+                return True
+            if isinstance(existing, dict):
+                created = "" not in existing
+                existing[""] = merged_leaf(existing.get("", ""), reference, merges)
+                return created
+            current[part] = merged_leaf(existing, reference, merges)
+            return False
 
         existing = current.get(part)
         if existing is None:
@@ -148,16 +566,49 @@ def set_leaf(root, path, reference):
         current = current[part]
 
 
-def reconstruct_map(flat_data, manifest, fallback_to_source=False):
-    items = manifest.get("items", [])
-    if not isinstance(items, list):
-        raise ValueError("Manifest must contain an items list")
+def merged_leaf(existing, reference, merges):
+    if merges is None:
+        return merge_references(str(existing), reference)
+    if isinstance(existing, MergedReference):
+        existing.add(reference)
+        return existing
+    merged = MergedReference(existing, reference)
+    merges.append(merged)
+    return merged
+
+
+def render_merged_references(data):
+    """Replace MergedReference leaves left by set_leaf(..., merges) with strings."""
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        for key, value in node.items():
+            if isinstance(value, dict):
+                stack.append(value)
+            elif isinstance(value, MergedReference):
+                node[key] = str(value)
+
+
+def reconstruct_map(flat_data, manifest, fallback_to_source=False, index=None, stats=None):
+    """
+    Rebuild the nested map from flat Transifex data. When a stats dict is
+    given, its "leaf_count" is set to the number of leaves in the result.
+    """
+    if index is None:
+        index = ManifestIndex(manifest)
 
     reconstructed = {}
-    for item in sorted(items, key=lambda entry: entry["order"]):
+    leaf_count = 0
+    merges = []
+    for item in index.items:
         path = translated_path_for(item, flat_data, fallback_to_source)
-        set_leaf(reconstructed, path, item["reference"])
+        if set_leaf(reconstructed, path, item["reference"], merges):
+            leaf_count += 1
+    if merges:
+        render_merged_references(reconstructed)
 
+    if stats is not None:
+        stats["leaf_count"] = leaf_count
     return reconstructed
 
 
@@ -176,6 +627,10 @@ def path_for_report(path):
 
 
 def strip_invisible_blank_chars(value):
+    # All invisible blank chars are non-ASCII. Chained replace() measured faster
+    # than str.translate() with a deletion table for ASCII, Cyrillic and Arabic text.
+    if value.isascii():
+        return value
     for char in INVISIBLE_BLANK_CHARS:
         value = value.replace(char, "")
     return value
@@ -185,35 +640,71 @@ def clean_path_part(value):
     return strip_invisible_blank_chars(value).strip()
 
 
-def normalize_map_path(path):
-    cleaned = [clean_path_part(part) for part in path]
-    cleaned = [part for part in cleaned if part]
-    if not cleaned:
-        return cleaned, cleaned != path
+def normalized_levels(cleaned):
+    """Drop empty levels and split a multi-character root into its letter and heading."""
+    levels = [part for part in cleaned if part]
+    if not levels or len(levels[0]) == 1:
+        return levels, False
+    root = levels[0]
+    if len(levels) == 1:
+        return [root[0], root], True
+    return [root[0]] + levels[1:], True
 
-    root = cleaned[0]
-    if len(root) == 1:
-        return cleaned, cleaned != path
 
-    normalized_root = root[0]
-    if len(cleaned) == 1:
-        normalized = [normalized_root, root]
-    else:
-        normalized = [normalized_root] + cleaned[1:]
-    return normalized, True
+def normalize_map_path(path):
+    cleaned = [clean_path_part(part) for part in path]
+    levels, root_split = normalized_levels(cleaned)
+    return levels, root_split or levels != path
+
+
+class NormalizedValue(NamedTuple):
+    """A translated path value split and cleaned once; see normalize_map_value."""
+
+    cleaned: tuple
+    levels: tuple
+    value: str
+    normalized: bool
+    blank: bool
+
+
+@functools.lru_cache(maxsize=NORMALIZED_VALUE_CACHE_SIZE)
+def normalize_map_value(value):
+    """
+    Normalize a newline-separated path value with one strip pass and one split.
+
+    Memoized per string, so a translation value that is checked for blanks,
+    normalized and compared against its source path is only processed once
+    per run. Agrees with normalize_map_path, is_blank_translation_value and
+    normalized_path_value.
+    """
+    cleaned = tuple(part.strip() for part in strip_invisible_blank_chars(value).split("\n"))
+    levels, root_split = normalized_levels(cleaned)
+    joined = "\n".join(levels)
+    # Cleaned levels never contain newlines, so comparing the joined string with
+    # the raw value tells whether any level changed or was dropped.
+    normalized = root_split or not levels or joined != value
+    return NormalizedValue(cleaned, tuple(levels), joined, normalized, not levels)
+
+
+def normalize_payload(flat_data):
+    """Normalize every string value of a flat payload; non-string values are left out."""
+    return {
+        key: normalize_map_value(value)
+        for key, value in flat_data.items()
+        if isinstance(value, str)
+    }
 
 
 def is_blank_translation_value(value):
     if not isinstance(value, str):
         return False
-    cleaned = strip_invisible_blank_chars(value)
-    return not any(part.strip() for part in cleaned.split("\n"))
+    return normalize_map_value(value).blank
 
 
 def normalized_path_value(value):
     if not isinstance(value, str):
         return []
-    return [clean_path_part(part) for part in value.split("\n")]
+    return list(normalize_map_value(value).cleaned)
 
 
 def path_from_report(value):
@@ -221,12 +712,43 @@ def path_from_report(value):
 
 
 def write_tsv(path, rows, fieldnames):
-    with open(path, "w", encoding="utf-8", newline="") as file:
+    with open(path, "w", encoding="utf-8", newline="", buffering=WRITE_BUFFER_SIZE) as file:
         writer = csv.DictWriter(file, fieldnames=fieldnames, delimiter="\t")
         writer.writeheader()
         writer.writerows(rows)
 
 
+def write_files_concurrently(writes):
+    """Run (writer, *args) jobs on a small thread pool and re-raise the first failure."""
+    with ThreadPoolExecutor(max_workers=REPORT_WRITER_THREADS) as executor:
+        futures = [executor.submit(writer, *writer_args) for writer, *writer_args in writes]
+        for future in futures:
+            future.result()
+
+
+def group_map_by_reference(map_data):
+    """
+    Group the leaves of a nested map by stripped reference in one traversal.
+
+    Returns (groups, leaf_count). Group items have the same order, source_path
+    and reference fields as manifest items but no Transifex key, so no path is
+    hashed.
+    """
+    groups = {}
+    leaf_count = 0
+    for order, (path, reference) in enumerate(walk_map(map_data)):
+        leaf_count += 1
+        stripped_reference = reference.strip()
+        if not stripped_reference:
+            continue
+        groups.setdefault(stripped_reference, []).append({
+            "order": order,
+            "source_path": list(path),
+            "reference": reference,
+        })
+    return groups, leaf_count
+
+
 def group_items_by_reference(manifest):
     groups = {}
     for item in sorted(manifest["items"], key=lambda entry: entry["order"]):
@@ -257,7 +779,7 @@ def build_legacy_items(map_data, hash_length=DEFAULT_HASH_LENGTH):
             "legacy_key": legacy_key,
             "duplicate_index": duplicate_index,
             "order": order,
-            "source_path": path,
+            "source_path": list(path),
             "reference": cleaned_reference,
             "new_key": make_tx_key(path, cleaned_reference, hash_length),
         })
@@ -265,21 +787,136 @@ def build_legacy_items(map_data, hash_length=DEFAULT_HASH_LENGTH):
     return items
 
 
-def set_reference_at_path(data, path, reference):
-    current = data
-    for part in path[:-1]:
-        current = current[part]
-    current[path[-1]] = reference
+class LegacyIndex:
+    """
+    Legacy 0__ref key lookups over one source map, built once and shared by
+    every legacy translation that is checked or converted against it.
+
+    Only the items are serialized; the lookup tables are derived on load.
+    """
+
+    def __init__(self, items, source_sha256=None, hash_length=DEFAULT_HASH_LENGTH):
+        self.items = items
+        self.source_sha256 = source_sha256
+        self.hash_length = hash_length
+        self.groups = {}
+        for item in items:
+            if item["reference"]:
+                self.groups.setdefault(item["reference"], []).append(item)
+        self.duplicate_references = {
+            reference
+            for reference, group in self.groups.items()
+            if len(group) > 1
+        }
+        self.duplicate_items = [item for item in items if item["reference"] in self.duplicate_references]
+        self.by_legacy_key = {item["legacy_key"]: item for item in items}
+        self.by_reference_path = {
+            (item["reference"], tuple(item["source_path"])): item
+            for item in items
+        }
 
+    @classmethod
+    def from_source(cls, source_data, hash_length=DEFAULT_HASH_LENGTH, source_sha256=None):
+        return cls(build_legacy_items(source_data, hash_length), source_sha256, hash_length)
+
+    def duplicate_source_entry_count(self):
+        return sum(len(self.groups[reference]) for reference in self.duplicate_references)
+
+    def to_json(self):
+        return {
+            "version": 1,
+            "kind": LEGACY_INDEX_KIND,
+            "source_sha256": self.source_sha256,
+            "hash_length": self.hash_length,
+            # Items are stored in source order, so order is the list position.
+            "items": [
+                [
+                    item["legacy_key"],
+                    item["duplicate_index"],
+                    item["source_path"],
+                    item["reference"],
+                    item["new_key"],
+                ]
+                for item in self.items
+            ],
+        }
 
-def key_by_source_path(manifest):
-    return {tuple(item["source_path"]): item["key"] for item in manifest["items"]}
+    @classmethod
+    def from_json(cls, data):
+        if data.get("kind") != LEGACY_INDEX_KIND or data.get("version") != 1:
+            raise ValueError("Not a version 1 legacy index")
+        items = [
+            {
+                "legacy_key": legacy_key,
+                "duplicate_index": duplicate_index,
+                "order": order,
+                "source_path": source_path,
+                "reference": reference,
+                "new_key": new_key,
+            }
+            for order, (legacy_key, duplicate_index, source_path, reference, new_key) in enumerate(data["items"])
+        ]
+        return cls(items, data["source_sha256"], data["hash_length"])
+
+
+def legacy_index_cache_path(cache_dir, source_sha256, hash_length):
+    return os.path.join(cache_dir, f"{source_sha256}-{hash_length}.json")
+
+
+def load_legacy_index(source_path, hash_length=DEFAULT_HASH_LENGTH, cache_dir=None):
+    """
+    Return (source_data, LegacyIndex) for a source map file.
+
+    With cache_dir, the index is read from a file named after the SHA-256 of the
+    source file content and the hash length, and written there on a miss, so an
+    unchanged source map never rebuilds its index.
+    """
+    with open(source_path, "rb") as file:
+        source_bytes = file.read()
+    source_data = json.loads(source_bytes)
+    source_sha256 = hashlib.sha256(source_bytes).hexdigest()
+    if not cache_dir:
+        return source_data, LegacyIndex.from_source(source_data, hash_length, source_sha256)
+
+    cache_path = legacy_index_cache_path(cache_dir, source_sha256, hash_length)
+    if os.path.exists(cache_path):
+        try:
+            index = LegacyIndex.from_json(load_json(cache_path))
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            print(f"Ignoring unreadable legacy index cache {cache_path}: {exc}")
+        else:
+            if index.source_sha256 == source_sha256 and index.hash_length == hash_length:
+                return source_data, index
+
+    index = LegacyIndex.from_source(source_data, hash_length, source_sha256)
+    os.makedirs(cache_dir, exist_ok=True)
+    temp_path = f"{cache_path}.tmp"
+    with open(temp_path, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as file:
+        json.dump(index.to_json(), file, ensure_ascii=False, separators=(",", ":"))
+        file.write("\n")
+    os.replace(temp_path, cache_path)
+    return source_data, index
 
 
-def stability_check_command(args):
-    source_data = load_json(args.source)
-    _, base_manifest = build_export(source_data, args.source, args.hash_length)
-    base_keys = key_by_source_path(base_manifest)
+def legacy_index_cache_dir_from_args(args):
+    return args.legacy_index_cache_dir if args.legacy_index_cache else None
+
+
+def check_key_stability(source_data, base_manifest, source_label, hash_length=DEFAULT_HASH_LENGTH, index=None):
+    """
+    Change each duplicated reference in turn and confirm no other entry of the
+    group gets a different Transifex key. base_manifest must come from
+    build_export(source_data, ...).
+
+    A key depends only on its own (path, reference), so a mutation is checked
+    by hashing the changed leaf alone: siblings keep the key recomputed from
+    their own path and reference, and the changed key must not collide with
+    any other key of the export.
+    """
+    if index is None:
+        index = ManifestIndex(base_manifest)
+    base_keys = index.key_by_path
+    base_items_by_key = index.item_by_key
     duplicate_groups = group_items_by_reference(base_manifest)
     duplicate_groups = {
         reference: items
@@ -292,14 +929,22 @@ def stability_check_command(args):
     checked_unchanged_paths = 0
 
     for reference, items in sorted(duplicate_groups.items()):
+        recomputed_keys = {
+            tuple(item["source_path"]): make_tx_key(item["source_path"], item["reference"], hash_length)
+            for item in items
+        }
         for changed_item in items:
             mutation_count += 1
             changed_path = changed_item["source_path"]
-            mutated = copy.deepcopy(source_data)
             changed_reference = f"{reference} [stability-check changed {mutation_count}]"
-            set_reference_at_path(mutated, changed_path, changed_reference)
-            _, mutated_manifest = build_export(mutated, args.source, args.hash_length)
-            mutated_keys = key_by_source_path(mutated_manifest)
+            changed_key = make_tx_key(changed_path, changed_reference, hash_length)
+            colliding_item = base_items_by_key.get(changed_key)
+            if colliding_item is not None and colliding_item["source_path"] != changed_path:
+                first, second = sorted((colliding_item, changed_item), key=lambda entry: entry["order"])
+                raise ValueError(
+                    "Transifex key collision. Increase HASH_LENGTH before exporting: "
+                    f"{changed_key} maps to both {first['source_path']!r} and {second['source_path']!r}"
+                )
 
             for item in items:
                 path_tuple = tuple(item["source_path"])
@@ -307,7 +952,7 @@ def stability_check_command(args):
                     continue
                 checked_unchanged_paths += 1
                 old_key = base_keys[path_tuple]
-                new_key = mutated_keys.get(path_tuple)
+                new_key = recomputed_keys[path_tuple]
                 if old_key != new_key:
                     failures.append({
                         "reference": reference,
@@ -317,8 +962,8 @@ def stability_check_command(args):
                         "new_key": new_key,
                     })
 
-    result = {
-        "source": os.path.normpath(args.source),
+    return {
+        "source": os.path.normpath(source_label),
         "duplicate_reference_group_count": len(duplicate_groups),
         "duplicate_reference_entry_count": sum(len(items) for items in duplicate_groups.values()),
         "mutation_count": mutation_count,
@@ -327,34 +972,67 @@ def stability_check_command(args):
         "failures": failures,
     }
 
-    if args.out:
-        os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
-        write_json(args.out, result)
+
+def write_stability_report(result, out_path=None):
+    if out_path:
+        os.makedirs(os.path.dirname(os.path.abspath(out_path)), exist_ok=True)
+        write_json(out_path, result)
 
     print(f"Duplicate reference groups:   {result['duplicate_reference_group_count']}")
     print(f"Duplicate reference entries:  {result['duplicate_reference_entry_count']}")
     print(f"Mutations tested:             {result['mutation_count']}")
     print(f"Unchanged paths checked:      {result['checked_unchanged_path_count']}")
     print(f"Key shift failures:           {result['failure_count']}")
-    if args.out:
-        print(f"Report:                       {args.out}")
-    if failures:
-        raise SystemExit(1)
+    if out_path:
+        print(f"Report:                       {out_path}")
 
 
-def indexed_report_command(args):
+def stability_check_command(args):
     source_data = load_json(args.source)
-    translated_data = load_json(args.translation)
+    _, base_manifest = build_export(source_data, args.source, args.hash_length)
+    result = check_key_stability(source_data, base_manifest, args.source, args.hash_length)
+    write_stability_report(result, args.out)
+    if result["failures"]:
+        raise SystemExit(1)
 
-    source_flat, source_manifest = build_export(source_data, args.source, args.hash_length)
-    translated_flat, translated_manifest = build_export(translated_data, args.translation, args.hash_length)
 
-    source_groups = group_items_by_reference(source_manifest)
-    translated_groups = group_items_by_reference(translated_manifest)
-    duplicate_references = sorted(
-        reference for reference, items in source_groups.items()
+def indexed_report_source(source_data, source_path, with_keys=False, hash_length=DEFAULT_HASH_LENGTH):
+    """Build the source side of indexed-report once so it can be shared across languages."""
+    context = {
+        "source": os.path.normpath(source_path),
+        "with_keys": with_keys,
+        "hash_length": hash_length,
+        "flat": None,
+        "manifest": None,
+    }
+    if with_keys:
+        context["flat"], context["manifest"] = build_export(source_data, source_path, hash_length)
+        context["groups"] = group_items_by_reference(context["manifest"])
+        context["key_count"] = len(context["flat"])
+    else:
+        context["groups"], context["key_count"] = group_map_by_reference(source_data)
+    context["duplicate_references"] = sorted(
+        reference for reference, items in context["groups"].items()
         if len(items) > 1
     )
+    return context
+
+
+def indexed_report_language(context, lang, translation_path, out_dir):
+    """Write the indexed report of one translated map against a shared source context."""
+    translated_data = load_json(translation_path)
+    with_keys = context["with_keys"]
+    source_groups = context["groups"]
+    source_key_count = context["key_count"]
+    duplicate_references = context["duplicate_references"]
+    if with_keys:
+        source_flat = context["flat"]
+        source_manifest = context["manifest"]
+        translated_flat, translated_manifest = build_export(translated_data, translation_path, context["hash_length"])
+        translated_groups = group_items_by_reference(translated_manifest)
+        translated_key_count = len(translated_flat)
+    else:
+        translated_groups, translated_key_count = group_map_by_reference(translated_data)
 
     common_rows = []
     missing_rows = []
@@ -369,7 +1047,7 @@ def indexed_report_command(args):
         group_rows.append({
             "reference": reference,
             "legacy_indexed_key_count": len(source_items),
-            f"{args.lang}_indexed_key_count": len(translated_items),
+            f"{lang}_indexed_key_count": len(translated_items),
             "common_indexed_key_count": common_count,
             "count_match": len(source_items) == len(translated_items),
         })
@@ -379,78 +1057,80 @@ def indexed_report_command(args):
             translated_item = translated_items[index]
             source_path = source_item["source_path"]
             translated_path = translated_item["source_path"]
-            common_rows.append({
+            row = {
                 "legacy_key": f"{index}__{reference}",
                 "duplicate_index": index,
                 "reference": reference,
-                "source_new_key": source_item["key"],
-                f"{args.lang}_new_key": translated_item["key"],
                 "source_path": path_for_report(source_path),
-                f"{args.lang}_path": path_for_report(translated_path),
+                f"{lang}_path": path_for_report(translated_path),
                 "source_leaf": path_leaf(source_path),
-                f"{args.lang}_leaf": path_leaf(translated_path),
+                f"{lang}_leaf": path_leaf(translated_path),
                 "source_depth": path_depth(source_path),
-                f"{args.lang}_depth": path_depth(translated_path),
+                f"{lang}_depth": path_depth(translated_path),
                 "depth_match": path_depth(source_path) == path_depth(translated_path),
                 "group_count_match": len(source_items) == len(translated_items),
-            })
+            }
+            if with_keys:
+                row["source_new_key"] = source_item["key"]
+                row[f"{lang}_new_key"] = translated_item["key"]
+            common_rows.append(row)
 
         for index in range(common_count, len(source_items)):
             source_item = source_items[index]
             source_path = source_item["source_path"]
-            missing_rows.append({
+            row = {
                 "legacy_key": f"{index}__{reference}",
                 "duplicate_index": index,
                 "reference": reference,
-                "source_new_key": source_item["key"],
                 "source_path": path_for_report(source_path),
                 "source_leaf": path_leaf(source_path),
                 "source_depth": path_depth(source_path),
-            })
+            }
+            if with_keys:
+                row["source_new_key"] = source_item["key"]
+            missing_rows.append(row)
 
         for index in range(common_count, len(translated_items)):
             translated_item = translated_items[index]
             translated_path = translated_item["source_path"]
-            extra_rows.append({
+            row = {
                 "legacy_key": f"{index}__{reference}",
                 "duplicate_index": index,
                 "reference": reference,
-                f"{args.lang}_new_key": translated_item["key"],
-                f"{args.lang}_path": path_for_report(translated_path),
-                f"{args.lang}_leaf": path_leaf(translated_path),
-                f"{args.lang}_depth": path_depth(translated_path),
-            })
-
-    os.makedirs(args.out_dir, exist_ok=True)
-    source_reverse_path = os.path.join(args.out_dir, "source_new_reversed.json")
-    translated_reverse_path = os.path.join(args.out_dir, f"{args.lang}_new_reversed.json")
-    source_manifest_path = os.path.join(args.out_dir, "source_new_manifest.json")
-    translated_manifest_path = os.path.join(args.out_dir, f"{args.lang}_new_manifest.json")
-    common_tsv_path = os.path.join(args.out_dir, "indexed_common_keys.tsv")
-    common_json_path = os.path.join(args.out_dir, "indexed_common_keys.json")
-    missing_tsv_path = os.path.join(args.out_dir, f"indexed_missing_in_{args.lang}.tsv")
-    extra_tsv_path = os.path.join(args.out_dir, f"indexed_extra_in_{args.lang}.tsv")
-    groups_tsv_path = os.path.join(args.out_dir, "indexed_reference_groups.tsv")
-    summary_path = os.path.join(args.out_dir, "summary.json")
-
-    write_json(source_reverse_path, source_flat, sort_keys=True)
-    write_json(translated_reverse_path, translated_flat, sort_keys=True)
-    write_json(source_manifest_path, source_manifest)
-    write_json(translated_manifest_path, translated_manifest)
-    write_json(common_json_path, common_rows)
-
+                f"{lang}_path": path_for_report(translated_path),
+                f"{lang}_leaf": path_leaf(translated_path),
+                f"{lang}_depth": path_depth(translated_path),
+            }
+            if with_keys:
+                row[f"{lang}_new_key"] = translated_item["key"]
+            extra_rows.append(row)
+
+    os.makedirs(out_dir, exist_ok=True)
+    source_reverse_path = os.path.join(out_dir, "source_new_reversed.json")
+    translated_reverse_path = os.path.join(out_dir, f"{lang}_new_reversed.json")
+    source_manifest_path = os.path.join(out_dir, "source_new_manifest.json")
+    translated_manifest_path = os.path.join(out_dir, f"{lang}_new_manifest.json")
+    common_tsv_path = os.path.join(out_dir, "indexed_common_keys.tsv")
+    common_json_path = os.path.join(out_dir, "indexed_common_keys.json")
+    missing_tsv_path = os.path.join(out_dir, f"indexed_missing_in_{lang}.tsv")
+    extra_tsv_path = os.path.join(out_dir, f"indexed_extra_in_{lang}.tsv")
+    groups_tsv_path = os.path.join(out_dir, "indexed_reference_groups.tsv")
+    summary_path = os.path.join(out_dir, "summary.json")
+
+    source_key_fields = ["source_new_key"] if with_keys else []
+    translated_key_fields = [f"{lang}_new_key"] if with_keys else []
     common_fields = [
         "legacy_key",
         "duplicate_index",
         "reference",
-        "source_new_key",
-        f"{args.lang}_new_key",
+        *source_key_fields,
+        *translated_key_fields,
         "source_path",
-        f"{args.lang}_path",
+        f"{lang}_path",
         "source_leaf",
-        f"{args.lang}_leaf",
+        f"{lang}_leaf",
         "source_depth",
-        f"{args.lang}_depth",
+        f"{lang}_depth",
         "depth_match",
         "group_count_match",
     ]
@@ -458,7 +1138,7 @@ def indexed_report_command(args):
         "legacy_key",
         "duplicate_index",
         "reference",
-        "source_new_key",
+        *source_key_fields,
         "source_path",
         "source_leaf",
         "source_depth",
@@ -467,97 +1147,101 @@ def indexed_report_command(args):
         "legacy_key",
         "duplicate_index",
         "reference",
-        f"{args.lang}_new_key",
-        f"{args.lang}_path",
-        f"{args.lang}_leaf",
-        f"{args.lang}_depth",
+        *translated_key_fields,
+        f"{lang}_path",
+        f"{lang}_leaf",
+        f"{lang}_depth",
     ]
     group_fields = [
         "reference",
         "legacy_indexed_key_count",
-        f"{args.lang}_indexed_key_count",
+        f"{lang}_indexed_key_count",
         "common_indexed_key_count",
         "count_match",
     ]
 
-    write_tsv(common_tsv_path, common_rows, common_fields)
-    write_tsv(missing_tsv_path, missing_rows, missing_fields)
-    write_tsv(extra_tsv_path, extra_rows, extra_fields)
-    write_tsv(groups_tsv_path, group_rows, group_fields)
+    # The JSON copy keeps the TSV column order.
+    common_json_rows = [{field: row[field] for field in common_fields} for row in common_rows]
+    writes = [
+        (write_json, common_json_path, common_json_rows),
+        (write_tsv, common_tsv_path, common_rows, common_fields),
+        (write_tsv, missing_tsv_path, missing_rows, missing_fields),
+        (write_tsv, extra_tsv_path, extra_rows, extra_fields),
+        (write_tsv, groups_tsv_path, group_rows, group_fields),
+    ]
+    files = {}
+    if with_keys:
+        writes.extend([
+            (write_json, source_reverse_path, source_flat, True),
+            (write_json, translated_reverse_path, translated_flat, True),
+            (write_json, source_manifest_path, source_manifest),
+            (write_json, translated_manifest_path, translated_manifest),
+        ])
+        files.update({
+            "source_new_reversed": source_reverse_path,
+            "translation_new_reversed": translated_reverse_path,
+            "source_new_manifest": source_manifest_path,
+            "translation_new_manifest": translated_manifest_path,
+        })
+    files.update({
+        "indexed_common_keys_tsv": common_tsv_path,
+        "indexed_common_keys_json": common_json_path,
+        "indexed_missing_in_translation_tsv": missing_tsv_path,
+        "indexed_extra_in_translation_tsv": extra_tsv_path,
+        "indexed_reference_groups_tsv": groups_tsv_path,
+    })
+    write_files_concurrently(writes)
 
     summary = {
-        "source": os.path.normpath(args.source),
-        "translation": os.path.normpath(args.translation),
-        "language": args.lang,
-        "source_new_key_count": len(source_flat),
-        "translation_new_key_count": len(translated_flat),
+        "source": context["source"],
+        "translation": os.path.normpath(translation_path),
+        "language": lang,
+        "source_new_key_count": source_key_count,
+        "translation_new_key_count": translated_key_count,
         "source_duplicate_reference_group_count": len(duplicate_references),
         "indexed_common_key_count": len(common_rows),
         "indexed_missing_in_translation_count": len(missing_rows),
         "indexed_extra_in_translation_count": len(extra_rows),
         "group_count_mismatch_count": sum(1 for row in group_rows if not row["count_match"]),
         "depth_mismatch_count": sum(1 for row in common_rows if not row["depth_match"]),
-        "files": {
-            "source_new_reversed": source_reverse_path,
-            "translation_new_reversed": translated_reverse_path,
-            "source_new_manifest": source_manifest_path,
-            "translation_new_manifest": translated_manifest_path,
-            "indexed_common_keys_tsv": common_tsv_path,
-            "indexed_common_keys_json": common_json_path,
-            "indexed_missing_in_translation_tsv": missing_tsv_path,
-            "indexed_extra_in_translation_tsv": extra_tsv_path,
-            "indexed_reference_groups_tsv": groups_tsv_path,
-        },
+        "files": files,
     }
     write_json(summary_path, summary)
+    return summary
+
 
-    print(f"Source new keys:             {len(source_flat)}")
-    print(f"{args.lang} new keys:                 {len(translated_flat)}")
-    print(f"Duplicate reference groups:  {len(duplicate_references)}")
-    print(f"Indexed common keys:         {len(common_rows)}")
-    print(f"Indexed missing in {args.lang}:       {len(missing_rows)}")
-    print(f"Indexed extra in {args.lang}:         {len(extra_rows)}")
+def indexed_report_command(args):
+    source_data = load_json(args.source)
+    context = indexed_report_source(source_data, args.source, args.with_keys, args.hash_length)
+    summary = indexed_report_language(context, args.lang, args.translation, args.out_dir)
+
+    print(f"Source new keys:             {summary['source_new_key_count']}")
+    print(f"{args.lang} new keys:                 {summary['translation_new_key_count']}")
+    print(f"Duplicate reference groups:  {summary['source_duplicate_reference_group_count']}")
+    print(f"Indexed common keys:         {summary['indexed_common_key_count']}")
+    print(f"Indexed missing in {args.lang}:       {summary['indexed_missing_in_translation_count']}")
+    print(f"Indexed extra in {args.lang}:         {summary['indexed_extra_in_translation_count']}")
     print(f"Group count mismatches:      {summary['group_count_mismatch_count']}")
     print(f"Depth mismatches:            {summary['depth_mismatch_count']}")
     print(f"Output directory:            {args.out_dir}")
 
 
-def legacy_shift_report_command(args):
-    source_data = load_json(args.source)
-    legacy_translation = load_json(args.legacy_translation)
-    source_items = build_legacy_items(source_data, args.hash_length)
-
-    source_groups = {}
-    for item in source_items:
-        reference = item["reference"]
-        if reference:
-            source_groups.setdefault(reference, []).append(item)
-
-    duplicate_references = {
-        reference
-        for reference, items in source_groups.items()
-        if len(items) > 1
-    }
-    source_by_legacy_key = {item["legacy_key"]: item for item in source_items}
-    source_by_reference_path = {
-        (item["reference"], tuple(item["source_path"])): item
-        for item in source_items
-    }
-    source_by_reference_leaf = {}
-    for item in source_items:
-        leaf = path_leaf(item["source_path"])
-        source_by_reference_leaf.setdefault((item["reference"], leaf), []).append(item)
+def legacy_shift_report_language(context, lang, legacy_translation_path, out_dir):
+    """Write the legacy shift report of one legacy translation against a shared LegacyIndex."""
+    legacy_translation = load_json(legacy_translation_path)
+    index = context["index"]
+    source_items = index.items
+    duplicate_references = index.duplicate_references
+    source_by_legacy_key = index.by_legacy_key
+    source_by_reference_path = index.by_reference_path
 
     suspect_rows = []
     all_duplicate_rows = []
     missing_rows = []
     extra_rows = []
 
-    for item in source_items:
+    for item in index.duplicate_items:
         reference = item["reference"]
-        if reference not in duplicate_references:
-            continue
-
         legacy_value = legacy_translation.get(item["legacy_key"])
         if legacy_value is None:
             row = {
@@ -568,8 +1252,8 @@ def legacy_shift_report_command(args):
                 "source_new_key": item["new_key"],
                 "source_path": path_for_report(item["source_path"]),
                 "source_depth": path_depth(item["source_path"]),
-                f"{args.lang}_legacy_path": "",
-                f"{args.lang}_depth": "",
+                f"{lang}_legacy_path": "",
+                f"{lang}_depth": "",
                 "matched_source_legacy_key": "",
                 "matched_source_new_key": "",
                 "matched_source_path": "",
@@ -591,8 +1275,8 @@ def legacy_shift_report_command(args):
                 "source_new_key": item["new_key"],
                 "source_path": path_for_report(item["source_path"]),
                 "source_depth": path_depth(item["source_path"]),
-                f"{args.lang}_legacy_path": "",
-                f"{args.lang}_depth": "",
+                f"{lang}_legacy_path": "",
+                f"{lang}_depth": "",
                 "matched_source_legacy_key": "",
                 "matched_source_new_key": "",
                 "matched_source_path": "",
@@ -603,11 +1287,6 @@ def legacy_shift_report_command(args):
 
         translated_path = legacy_value.split("\n")
         exact_match = source_by_reference_path.get((reference, tuple(translated_path)))
-        leaf_matches = source_by_reference_leaf.get((reference, path_leaf(translated_path)), [])
-        other_leaf_matches = [
-            match for match in leaf_matches
-            if match["legacy_key"] != item["legacy_key"]
-        ]
 
         issues = []
         notes = []
@@ -640,8 +1319,8 @@ def legacy_shift_report_command(args):
             "source_new_key": item["new_key"],
             "source_path": path_for_report(item["source_path"]),
             "source_depth": path_depth(item["source_path"]),
-            f"{args.lang}_legacy_path": path_for_report(translated_path),
-            f"{args.lang}_depth": path_depth(translated_path),
+            f"{lang}_legacy_path": path_for_report(translated_path),
+            f"{lang}_depth": path_depth(translated_path),
             "matched_source_legacy_key": exact_match["legacy_key"] if exact_match else "",
             "matched_source_new_key": exact_match["new_key"] if exact_match else "",
             "matched_source_path": path_for_report(exact_match["source_path"]) if exact_match else "",
@@ -668,8 +1347,8 @@ def legacy_shift_report_command(args):
             "source_new_key": "",
             "source_path": "",
             "source_depth": "",
-            f"{args.lang}_legacy_path": path_for_report(translated_path),
-            f"{args.lang}_depth": path_depth(translated_path),
+            f"{lang}_legacy_path": path_for_report(translated_path),
+            f"{lang}_depth": path_depth(translated_path),
             "matched_source_legacy_key": "",
             "matched_source_new_key": "",
             "matched_source_path": "",
@@ -686,18 +1365,18 @@ def legacy_shift_report_command(args):
         "source_new_key",
         "source_path",
         "source_depth",
-        f"{args.lang}_legacy_path",
-        f"{args.lang}_depth",
+        f"{lang}_legacy_path",
+        f"{lang}_depth",
         "matched_source_legacy_key",
         "matched_source_new_key",
         "matched_source_path",
         "note",
     ]
 
-    os.makedirs(args.out_dir, exist_ok=True)
-    suspects_path = os.path.join(args.out_dir, f"{args.lang}_legacy_shift_suspects.tsv")
-    all_rows_path = os.path.join(args.out_dir, f"{args.lang}_legacy_duplicate_all.tsv")
-    summary_path = os.path.join(args.out_dir, "summary.json")
+    os.makedirs(out_dir, exist_ok=True)
+    suspects_path = os.path.join(out_dir, f"{lang}_legacy_shift_suspects.tsv")
+    all_rows_path = os.path.join(out_dir, f"{lang}_legacy_duplicate_all.tsv")
+    summary_path = os.path.join(out_dir, "summary.json")
 
     write_tsv(suspects_path, suspect_rows, fields)
     write_tsv(all_rows_path, all_duplicate_rows, fields)
@@ -708,16 +1387,13 @@ def legacy_shift_report_command(args):
             issue_counts[issue] = issue_counts.get(issue, 0) + 1
 
     summary = {
-        "source": os.path.normpath(args.source),
-        "legacy_translation": os.path.normpath(args.legacy_translation),
-        "language": args.lang,
+        "source": context["source"],
+        "legacy_translation": os.path.normpath(legacy_translation_path),
+        "language": lang,
         "source_legacy_key_count": len(source_items),
         "legacy_translation_key_count": len(legacy_translation),
         "duplicate_reference_group_count": len(duplicate_references),
-        "duplicate_reference_source_entry_count": sum(
-            len(source_groups[reference])
-            for reference in duplicate_references
-        ),
+        "duplicate_reference_source_entry_count": index.duplicate_source_entry_count(),
         "suspect_row_count": len(suspect_rows),
         "all_duplicate_row_count": len(all_duplicate_rows),
         "missing_duplicate_key_count": len(missing_rows),
@@ -729,14 +1405,21 @@ def legacy_shift_report_command(args):
         },
     }
     write_json(summary_path, summary)
+    return summary
+
+
+def legacy_shift_report_command(args):
+    _source_data, index = load_legacy_index(args.source, args.hash_length, legacy_index_cache_dir_from_args(args))
+    context = {"source": os.path.normpath(args.source), "index": index}
+    summary = legacy_shift_report_language(context, args.lang, args.legacy_translation, args.out_dir)
 
-    print(f"Source legacy keys:          {len(source_items)}")
-    print(f"{args.lang} legacy keys:              {len(legacy_translation)}")
-    print(f"Duplicate reference groups:  {len(duplicate_references)}")
+    print(f"Source legacy keys:          {summary['source_legacy_key_count']}")
+    print(f"{args.lang} legacy keys:              {summary['legacy_translation_key_count']}")
+    print(f"Duplicate reference groups:  {summary['duplicate_reference_group_count']}")
     print(f"Duplicate source rows:       {summary['duplicate_reference_source_entry_count']}")
-    print(f"Suspect rows:                {len(suspect_rows)}")
-    print(f"Missing duplicate keys:      {len(missing_rows)}")
-    print(f"Extra duplicate keys:        {len(extra_rows)}")
+    print(f"Suspect rows:                {summary['suspect_row_count']}")
+    print(f"Missing duplicate keys:      {summary['missing_duplicate_key_count']}")
+    print(f"Extra duplicate keys:        {summary['extra_duplicate_key_count']}")
     print(f"Output directory:            {args.out_dir}")
 
 
@@ -808,10 +1491,19 @@ def apply_legacy_corrections_command(args):
         print(f"Audit TSV:                   {args.audit}")
 
 
-def legacy_to_stable_command(args):
-    source_data = load_json(args.source)
-    legacy_translation = load_json(args.legacy_translation)
-    source_items = build_legacy_items(source_data, args.hash_length)
+def convert_legacy_to_stable(
+    source_items,
+    legacy_translation,
+    out_path,
+    audit_path=None,
+    omit_source_matches=False,
+    source_order=False,
+):
+    """
+    Write the stable-key translation for one legacy translation and return its counts.
+
+    source_items come from build_legacy_items and can be shared across languages.
+    """
 
     stable_translation = {}
     audit_rows = []
@@ -839,15 +1531,16 @@ def legacy_to_stable_command(args):
             blank_count += 1
             omitted = True
             omit_reason = "blank_translation_value"
-        elif args.omit_source_matches and normalized_path_value(value) == item["source_path"]:
+        elif omit_source_matches and normalized_path_value(value) == item["source_path"]:
             source_match_count += 1
             omitted = True
             omit_reason = "matches_source_path"
         else:
-            normalized_path, normalized = normalize_map_path(value.split("\n"))
+            normalized_value = normalize_map_value(value)
+            normalized = normalized_value.normalized
             if normalized:
                 normalized_path_count += 1
-                output_value = "\n".join(normalized_path)
+                output_value = normalized_value.value
 
         if not omitted:
             stable_translation[item["new_key"]] = output_value
@@ -864,13 +1557,13 @@ def legacy_to_stable_command(args):
             "omit_reason": omit_reason,
         })
 
-    os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
-    write_json(args.out, stable_translation, sort_keys=not args.source_order)
+    os.makedirs(os.path.dirname(os.path.abspath(out_path)), exist_ok=True)
+    write_json(out_path, stable_translation, sort_keys=not source_order)
 
-    if args.audit:
-        os.makedirs(os.path.dirname(os.path.abspath(args.audit)), exist_ok=True)
+    if audit_path:
+        os.makedirs(os.path.dirname(os.path.abspath(audit_path)), exist_ok=True)
         write_tsv(
-            args.audit,
+            audit_path,
             audit_rows,
             [
                 "legacy_key",
@@ -885,15 +1578,21 @@ def legacy_to_stable_command(args):
             ],
         )
 
-    print(f"Source entries:              {len(source_items)}")
-    print(f"Stable translation keys:     {len(stable_translation)}")
-    print(f"Missing legacy keys:         {missing_count}")
-    print(f"Omitted blank values:        {blank_count}")
-    print(f"Normalized root paths:       {normalized_path_count}")
-    if args.omit_source_matches:
-        print(f"Omitted source matches:      {source_match_count}")
+    result = {
+        "source_entry_count": len(source_items),
+        "legacy_translation_key_count": len(legacy_translation),
+        "stable_translation_key_count": len(stable_translation),
+        "missing_legacy_key_count": missing_count,
+        "omitted_blank_value_count": blank_count,
+        "normalized_root_path_count": normalized_path_count,
+        "files": {"stable_translation": out_path},
+    }
+    if audit_path:
+        result["files"]["audit_tsv"] = audit_path
+    if omit_source_matches:
+        result["omitted_source_match_count"] = source_match_count
     else:
-        included_source_matches = sum(
+        result["included_source_match_count"] = sum(
             1
             for item in source_items
             if (
@@ -903,12 +1602,190 @@ def legacy_to_stable_command(args):
                 and normalized_path_value(legacy_translation[item["legacy_key"]]) == item["source_path"]
             )
         )
-        print(f"Included source matches:     {included_source_matches}")
+    return result
+
+
+def legacy_to_stable_command(args):
+    _source_data, index = load_legacy_index(args.source, args.hash_length, legacy_index_cache_dir_from_args(args))
+    legacy_translation = load_json(args.legacy_translation)
+    result = convert_legacy_to_stable(
+        index.items,
+        legacy_translation,
+        args.out,
+        audit_path=args.audit,
+        omit_source_matches=args.omit_source_matches,
+        source_order=args.source_order,
+    )
+
+    print(f"Source entries:              {result['source_entry_count']}")
+    print(f"Stable translation keys:     {result['stable_translation_key_count']}")
+    print(f"Missing legacy keys:         {result['missing_legacy_key_count']}")
+    print(f"Omitted blank values:        {result['omitted_blank_value_count']}")
+    print(f"Normalized root paths:       {result['normalized_root_path_count']}")
+    if args.omit_source_matches:
+        print(f"Omitted source matches:      {result['omitted_source_match_count']}")
+    else:
+        print(f"Included source matches:     {result['included_source_match_count']}")
     print(f"Stable translation JSON:     {args.out}")
     if args.audit:
         print(f"Audit TSV:                   {args.audit}")
 
 
+def legacy_to_stable_language(context, lang, legacy_translation_path, out_dir):
+    legacy_translation = load_json(legacy_translation_path)
+    result = convert_legacy_to_stable(
+        context["items"],
+        legacy_translation,
+        os.path.join(out_dir, f"{lang}_stable_translation.json"),
+        audit_path=os.path.join(out_dir, f"{lang}_stable_translation_audit.tsv"),
+        omit_source_matches=context["omit_source_matches"],
+        source_order=context["source_order"],
+    )
+    result.update({
+        "source": context["source"],
+        "legacy_translation": os.path.normpath(legacy_translation_path),
+        "language": lang,
+    })
+    return result
+
+
+def batch_translation_files(patterns, lang_pattern=BATCH_LANG_PATTERN, languages=None):
+    """
+    Resolve directories, globs and files to {lang: path}.
+
+    Directories contribute their map_<lang>.json files, directly or one level down
+    as in app/src/assets/translations/<lang>/. The language code is read from the
+    file name with lang_pattern, which must define a "lang" group.
+    """
+    lang_re = re.compile(lang_pattern)
+    files = {}
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            paths = glob.glob(os.path.join(pattern, "map_*.json")) + glob.glob(os.path.join(pattern, "*", "map_*.json"))
+        else:
+            paths = glob.glob(pattern)
+            if not paths:
+                raise FileNotFoundError(f"No translation files match {pattern}")
+        for path in sorted(paths):
+            match = lang_re.search(os.path.basename(path))
+            if not match:
+                raise ValueError(f"Cannot read a language code from {path}; pass --lang-pattern")
+            lang = match.group("lang")
+            if lang in files and os.path.abspath(files[lang]) != os.path.abspath(path):
+                raise ValueError(f"Two translation files for {lang}: {files[lang]} and {path}")
+            files[lang] = path
+    if languages:
+        files = {lang: path for lang, path in files.items() if lang in set(languages)}
+    if not files:
+        raise FileNotFoundError("No translation files to process")
+    return dict(sorted(files.items()))
+
+
+def init_batch_worker(report, context):
+    _BATCH_WORKER_STATE.update({"report": report, "context": context})
+
+
+def run_batch_language(lang, translation_path, out_dir):
+    return _BATCH_WORKER_STATE["report"](_BATCH_WORKER_STATE["context"], lang, translation_path, out_dir)
+
+
+def run_batch(command, report, context, files, out_dir, total_fields, workers=1):
+    """
+    Run report(context, lang, path, lang_out_dir) for every language and write batch_summary.json.
+
+    The source context is built once by the caller; with several workers it is
+    sent to each worker process once instead of being rebuilt per language.
+    total_fields name the per-language counts that are added up in the summary.
+    """
+    lang_out_dirs = {lang: os.path.join(out_dir, lang) for lang in files}
+    for lang_out_dir in lang_out_dirs.values():
+        os.makedirs(lang_out_dir, exist_ok=True)
+
+    langs = list(files)
+    workers = min(workers, len(langs))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_batch_worker, initargs=(report, context)) as executor:
+            summaries = list(executor.map(
+                run_batch_language,
+                langs,
+                [files[lang] for lang in langs],
+                [lang_out_dirs[lang] for lang in langs],
+            ))
+    else:
+        summaries = [report(context, lang, files[lang], lang_out_dirs[lang]) for lang in langs]
+
+    totals = {name: sum(summary[name] for summary in summaries) for name in total_fields}
+    batch_summary = {
+        "command": command,
+        "source": context["source"],
+        "language_count": len(langs),
+        "totals": totals,
+        "languages": dict(zip(langs, summaries)),
+    }
+    summary_path = os.path.join(out_dir, "batch_summary.json")
+    write_json(summary_path, batch_summary)
+    return batch_summary, summary_path
+
+
+INDEXED_REPORT_BATCH_COLUMNS = [
+    ("indexed_common_key_count", "common"),
+    ("indexed_missing_in_translation_count", "missing"),
+    ("indexed_extra_in_translation_count", "extra"),
+    ("group_count_mismatch_count", "group mismatches"),
+    ("depth_mismatch_count", "depth mismatches"),
+]
+LEGACY_SHIFT_BATCH_COLUMNS = [
+    ("suspect_row_count", "suspects"),
+    ("missing_duplicate_key_count", "missing"),
+    ("extra_duplicate_key_count", "extra"),
+]
+LEGACY_TO_STABLE_BATCH_COLUMNS = [
+    ("stable_translation_key_count", "stable keys"),
+    ("missing_legacy_key_count", "missing"),
+    ("omitted_blank_value_count", "blank"),
+    ("normalized_root_path_count", "normalized"),
+]
+
+
+def run_batch_command(args, command, report, context, columns):
+    files = batch_translation_files(args.translations, args.lang_pattern, args.lang)
+    batch_summary, summary_path = run_batch(
+        command,
+        report,
+        context,
+        files,
+        args.out_dir,
+        [name for name, _label in columns],
+        args.workers,
+    )
+    for lang, summary in batch_summary["languages"].items():
+        counts = ", ".join(f"{label}: {summary[name]}" for name, label in columns)
+        print(f"{lang}: {counts}")
+    print(f"\nLanguages:                   {batch_summary['language_count']}")
+    print(f"Batch summary:               {summary_path}")
+
+
+def indexed_report_batch_command(args):
+    context = indexed_report_source(load_json(args.source), args.source, args.with_keys, args.hash_length)
+    run_batch_command(args, "indexed-report", indexed_report_language, context, INDEXED_REPORT_BATCH_COLUMNS)
+
+
+def legacy_shift_report_batch_command(args):
+    _source_data, index = load_legacy_index(args.source, args.hash_length, legacy_index_cache_dir_from_args(args))
+    context = {"source": os.path.normpath(args.source), "index": index}
+    run_batch_command(args, "legacy-shift-report", legacy_shift_report_language, context, LEGACY_SHIFT_BATCH_COLUMNS)
+
+
+def legacy_to_stable_batch_command(args):
+    _source_data, index = load_legacy_index(args.source, args.hash_length, legacy_index_cache_dir_from_args(args))
+    context = {
+        "source": os.path.normpath(args.source),
+        "items": index.items,
+        "omit_source_matches": args.omit_source_matches,
+        "source_order": args.source_order,
+    }
+    run_batch_command(args, "legacy-to-stable", legacy_to_stable_language, context, LEGACY_TO_STABLE_BATCH_COLUMNS)
+
 
 def export_command(args):
     map_data = load_json(args.input)
@@ -918,15 +1795,46 @@ def export_command(args):
     os.makedirs(os.path.dirname(os.path.abspath(args.manifest)), exist_ok=True)
     write_json(args.out, flat, sort_keys=not args.source_order)
     write_json(args.manifest, manifest)
+    if args.binary_manifest:
+        os.makedirs(os.path.dirname(os.path.abspath(args.binary_manifest)), exist_ok=True)
+        write_binary_manifest(args.binary_manifest, manifest)
 
     print(f"Exported {len(flat)} map entries")
     print(f"Transifex JSON: {args.out}")
     print(f"Manifest:       {args.manifest}")
+    if args.binary_manifest:
+        print(f"Binary manifest: {args.binary_manifest}")
+
+
+def pack_manifest_command(args):
+    manifest = load_manifest(args.manifest)
+    os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+    if args.json:
+        write_json(args.out, manifest)
+    else:
+        write_binary_manifest(args.out, manifest)
+    print(f"Packed {len(manifest['items'])} manifest items")
+    print(f"Manifest: {args.out}")
+
+
+def manifest_lookup_command(args):
+    if is_binary_manifest(args.manifest):
+        with BinaryManifest(args.manifest) as binary_manifest:
+            items = [binary_manifest.lookup(tx_key) for tx_key in args.keys]
+    else:
+        items_by_key = {item["key"]: item for item in load_json(args.manifest)["items"]}
+        items = [items_by_key.get(tx_key) for tx_key in args.keys]
+
+    missing = [tx_key for tx_key, item in zip(args.keys, items) if item is None]
+    print(json.dumps([item for item in items if item is not None], ensure_ascii=False, indent=4))
+    if missing:
+        print(f"Missing keys: {', '.join(missing)}")
+        raise SystemExit(1)
 
 
 def import_command(args):
     flat_data = load_json(args.input)
-    manifest = load_json(args.manifest)
+    manifest = load_manifest(args.manifest)
     reconstructed = reconstruct_map(flat_data, manifest, fallback_to_source=args.fallback_to_source)
 
     os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
@@ -966,6 +1874,38 @@ def build_parser():
         ),
     )
 
+    parser.add_argument(
+        "--hash-cache",
+        action="store_true",
+        help=(
+            "Reuse path hashes from a persistent cache and add new ones to it. "
+            "Keys are identical with or without the cache."
+        ),
+    )
+    parser.add_argument(
+        "--hash-cache-file",
+        metavar="PATH",
+        default=path_hash_cache_path_for(DEFAULT_MANIFEST),
+        help=f"Path hash cache used with --hash-cache. Default: {path_hash_cache_path_for(DEFAULT_MANIFEST)}",
+    )
+    parser.add_argument(
+        "--legacy-index-cache",
+        action="store_true",
+        help=(
+            "Reuse the legacy key index of the source map from a cache keyed by the source "
+            "content hash (legacy-shift-report, legacy-to-stable and their batch variants)."
+        ),
+    )
+    parser.add_argument(
+        "--legacy-index-cache-dir",
+        metavar="DIR",
+        default=os.path.join(SCRIPT_DIR, LEGACY_INDEX_CACHE_DIRNAME),
+        help=(
+            "Directory for legacy index cache files used with --legacy-index-cache. "
+            f"Default: {os.path.join(SCRIPT_DIR, LEGACY_INDEX_CACHE_DIRNAME)}"
+        ),
+    )
+
     subparsers = parser.add_subparsers(dest="command", required=True)
 
     export_parser = subparsers.add_parser(
@@ -992,6 +1932,11 @@ def build_parser():
         action="store_true",
         help="Write flat JSON in source traversal order. Default writes sorted keys for stable diffs.",
     )
+    export_parser.add_argument(
+        "--binary-manifest",
+        metavar="PATH",
+        help="Also write the manifest in the compact binary form. The JSON manifest stays the reviewed copy.",
+    )
     export_parser.set_defaults(func=export_command)
 
     import_parser = subparsers.add_parser(
@@ -1005,7 +1950,7 @@ def build_parser():
         ),
     )
     import_parser.add_argument("input", help="Flat JSON downloaded from Transifex")
-    import_parser.add_argument("--manifest", required=True, help="Manifest produced by the export command")
+    import_parser.add_argument("--manifest", required=True, help="Manifest produced by the export command (JSON or binary)")
     import_parser.add_argument("--out", required=True, help="Output nested client map JSON")
     import_parser.add_argument(
         "--fallback-to-source",
@@ -1014,6 +1959,36 @@ def build_parser():
     )
     import_parser.set_defaults(func=import_command)
 
+    pack_manifest_parser = subparsers.add_parser(
+        "pack-manifest",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        help="Convert a manifest between the JSON and compact binary forms",
+        description=(
+            "Write a manifest in the compact binary form (or back to JSON with --json).\n\n"
+            "The binary form interns path segments and references and keeps a sorted path-hash\n"
+            "table, so single keys can be looked up through mmap without loading every item.\n"
+            "The JSON manifest remains the committed, reviewable copy."
+        ),
+        epilog=(
+            "Example:\n"
+            "  python3 scrapper/map-work/map_tx.py pack-manifest scrapper/map-work/map_tx_manifest.json \\\n"
+            "    --out /tmp/map_tx_manifest.bin"
+        ),
+    )
+    pack_manifest_parser.add_argument("manifest", help="JSON or binary manifest")
+    pack_manifest_parser.add_argument("--out", required=True, help="Output manifest path")
+    pack_manifest_parser.add_argument("--json", action="store_true", help="Write JSON instead of the binary form")
+    pack_manifest_parser.set_defaults(func=pack_manifest_command)
+
+    manifest_lookup_parser = subparsers.add_parser(
+        "manifest-lookup",
+        help="Print the manifest items for the given Transifex keys",
+        description="Look up single keys; binary manifests are searched through mmap without a full load.",
+    )
+    manifest_lookup_parser.add_argument("manifest", help="JSON or binary manifest")
+    manifest_lookup_parser.add_argument("keys", nargs="+", metavar="KEY", help="Transifex key(s) to look up")
+    manifest_lookup_parser.set_defaults(func=manifest_lookup_command)
+
     indexed_report_parser = subparsers.add_parser(
         "indexed-report",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -1038,11 +2013,19 @@ def build_parser():
     indexed_report_parser.add_argument("translation", help="Nested translated map JSON")
     indexed_report_parser.add_argument("--lang", required=True, help="Language code used in output filenames")
     indexed_report_parser.add_argument("--out-dir", required=True, help="Directory for generated report files")
+    indexed_report_parser.add_argument(
+        "--with-keys",
+        action="store_true",
+        help=(
+            "Also compute stable Transifex keys: adds the *_new_key columns and writes the "
+            "reversed and manifest JSON files. Off by default because it hashes every path."
+        ),
+    )
     indexed_report_parser.add_argument(
         "--hash-length",
         type=int,
         default=DEFAULT_HASH_LENGTH,
-        help=f"Number of SHA-1 hex chars to keep in each key. Default: {DEFAULT_HASH_LENGTH}",
+        help=f"Number of SHA-1 hex chars to keep in each key with --with-keys. Default: {DEFAULT_HASH_LENGTH}",
     )
     indexed_report_parser.set_defaults(func=indexed_report_command)
 
@@ -1187,15 +2170,93 @@ def build_parser():
     )
     legacy_to_stable_parser.set_defaults(func=legacy_to_stable_command)
 
+    for name, func, translations_help, example_translations in [
+        (
+            "indexed-report-batch",
+            indexed_report_batch_command,
+            "Translated map JSON files, directories or globs",
+            "app/src/assets/translations",
+        ),
+        (
+            "legacy-shift-report-batch",
+            legacy_shift_report_batch_command,
+            "Legacy translation JSON files, directories or globs",
+            "'scrapper/map-work/out/*-legacy-shift/*_transifex_legacy_raw.json'",
+        ),
+        (
+            "legacy-to-stable-batch",
+            legacy_to_stable_batch_command,
+            "Corrected legacy translation JSON files, directories or globs",
+            "'scrapper/map-work/out/*-new-system/*_transifex_legacy_corrected.json'",
+        ),
+    ]:
+        single_name = name[:-len("-batch")]
+        batch_parser = subparsers.add_parser(
+            name,
+            formatter_class=argparse.RawDescriptionHelpFormatter,
+            help=f"Run {single_name} for many languages against one source map",
+            description=(
+                f"Run {single_name} for every translation file found in the given directories,\n"
+                "globs or files. The source map side is built once and languages run in\n"
+                "parallel with --workers. Each language writes to <out-dir>/<lang>/ and\n"
+                "<out-dir>/batch_summary.json combines the per-language summaries.\n\n"
+                "Directories contribute map_<lang>.json files, directly or one level down.\n"
+                "The language code is read from each file name with --lang-pattern."
+            ),
+            epilog=(
+                "Example:\n"
+                f"  python3 scrapper/map-work/map_tx.py {name} \\\n"
+                "    app/src/assets/map.json \\\n"
+                f"    {example_translations} \\\n"
+                f"    --workers 4 --out-dir scrapper/map-work/out/{single_name}-all"
+            ),
+        )
+        batch_parser.add_argument("source", help="Nested English source map JSON")
+        batch_parser.add_argument("translations", nargs="+", metavar="TRANSLATIONS", help=translations_help)
+        batch_parser.add_argument("--out-dir", required=True, help="Directory for per-language report directories")
+        batch_parser.add_argument("--lang", nargs="+", metavar="CODE", help="Only process these language codes")
+        batch_parser.add_argument(
+            "--lang-pattern",
+            default=BATCH_LANG_PATTERN,
+            help="Regex with a 'lang' group matched against file names. Default matches map_<lang>.json and <lang>_*.json.",
+        )
+        batch_parser.add_argument("--workers", type=int, default=1, help="Languages processed in parallel. Default: 1.")
+        if name == "indexed-report-batch":
+            batch_parser.add_argument(
+                "--with-keys",
+                action="store_true",
+                help="Also compute stable Transifex keys, as in indexed-report --with-keys.",
+            )
+        if name == "legacy-to-stable-batch":
+            batch_parser.add_argument(
+                "--omit-source-matches",
+                action="store_true",
+                help="Omit values that exactly match the English source path, as in legacy-to-stable.",
+            )
+            batch_parser.add_argument(
+                "--source-order",
+                action="store_true",
+                help="Write stable JSON in source traversal order. Default writes sorted keys.",
+            )
+        batch_parser.add_argument(
+            "--hash-length",
+            type=int,
+            default=DEFAULT_HASH_LENGTH,
+            help=f"Number of SHA-1 hex chars to keep in each key. Default: {DEFAULT_HASH_LENGTH}",
+        )
+        batch_parser.set_defaults(func=func)
+
     stability_parser = subparsers.add_parser(
         "stability-check",
         formatter_class=argparse.RawDescriptionHelpFormatter,
         help="Unit-test stable keys against legacy duplicate-reference shift risk",
         description=(
             "Test every duplicate-reference group in the source map.\n\n"
-            "For each legacy-indexed group, this command changes one referenced leaf at a time\n"
-            "and verifies that all other leaves in that same group keep exactly the same new\n"
-            "stable key. If any unchanged path's key changes, the command exits with failure."
+            "A stable key depends only on its own leaf, so nothing is mutated: each group's keys\n"
+            "are recomputed once from path and reference and compared with the exported keys,\n"
+            "and a simulated reference edit of each leaf is hashed alone and checked against\n"
+            "every other exported key. The command exits with failure if any key differs from\n"
+            "the export or an edited key collides with another path."
         ),
         epilog=(
             "Example:\n"
@@ -1219,7 +2280,13 @@ def build_parser():
 def main():
     parser = build_parser()
     args = parser.parse_args()
+    if getattr(args, "workers", 1) < 1:
+        parser.error("--workers must be at least 1")
+    if args.hash_cache:
+        load_path_hash_cache(args.hash_cache_file)
     args.func(args)
+    if args.hash_cache:
+        save_path_hash_cache(args.hash_cache_file)
 
 
 if __name__ == "__main__":
@@ -1,11 +1,15 @@
 import argparse
+import cProfile
 import csv
 import importlib.util
 import json
 import os
 import re
-import subprocess
+import resource
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
 
 
@@ -14,11 +18,13 @@ REPO_ROOT = os.path.normpath(os.path.join(SCRIPT_DIR, "../.."))
 DEFAULT_SOURCE = os.path.join(REPO_ROOT, "app/src/assets/map.json")
 DEFAULT_MANIFEST = os.path.join(SCRIPT_DIR, "map_tx_manifest.json")
 DEFAULT_PULL_SCRIPT = os.path.join(REPO_ROOT, "scrapper/translation-work/pull_translations.py")
-DEFAULT_PYTHON = os.path.join(REPO_ROOT, "scrapper/.venv/bin/python")
 DEFAULT_LANGUAGES_FILE = os.path.join(REPO_ROOT, "scrapper/translation-work/supported-languages.json")
 DEFAULT_LOCAL_TRANSLATIONS_DIR = os.path.join(REPO_ROOT, "app/src/assets/translations")
 TX_HASH_RE = re.compile(r"^[0-9a-f]{40}$")
 _COLLATOR_CLASSES = None
+_COLLATORS = {}
+_SORT_KEY_MEMOS = {}
+TRACE_KIND = "quran-tft-map-update-trace"
 
 
 def load_json(path):
@@ -47,6 +53,105 @@ def write_tsv(path, rows, fieldnames):
         writer.writerows(rows)
 
 
+def read_process_io():
+    """Return (bytes read, bytes written) by this process, or (None, None) without /proc."""
+    try:
+        with open("/proc/self/io", "r", encoding="ascii") as file:
+            counters = dict(line.split(": ", 1) for line in file.read().splitlines())
+    except OSError:
+        return None, None
+    return int(counters["rchar"]), int(counters["wchar"])
+
+
+def resource_snapshot():
+    own = resource.getrusage(resource.RUSAGE_SELF)
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    bytes_read, bytes_written = read_process_io()
+    # ru_maxrss is kilobytes on Linux and bytes on macOS.
+    rss_scale = 1 if sys.platform == "darwin" else 1024
+    return {
+        "wall": time.perf_counter(),
+        "cpu": own.ru_utime + own.ru_stime + children.ru_utime + children.ru_stime,
+        "peak_rss": max(own.ru_maxrss, children.ru_maxrss) * rss_scale,
+        "bytes_read": bytes_read,
+        "bytes_written": bytes_written,
+    }
+
+
+def resource_delta(before, after):
+    def counter_delta(name):
+        if before[name] is None or after[name] is None:
+            return None
+        return after[name] - before[name]
+
+    return {
+        "wall_seconds": round(after["wall"] - before["wall"], 6),
+        "cpu_seconds": round(after["cpu"] - before["cpu"], 6),
+        "peak_rss_bytes": after["peak_rss"],
+        "bytes_read": counter_delta("bytes_read"),
+        "bytes_written": counter_delta("bytes_written"),
+    }
+
+
+def measured_call(func, *args, profile_path=None):
+    """Call func(*args) and return (result, resource usage of the call)."""
+    profiler = cProfile.Profile() if profile_path else None
+    before = resource_snapshot()
+    if profiler:
+        profiler.enable()
+    try:
+        result = func(*args)
+    finally:
+        if profiler:
+            profiler.disable()
+            os.makedirs(os.path.dirname(os.path.abspath(profile_path)), exist_ok=True)
+            profiler.dump_stats(profile_path)
+    return result, resource_delta(before, resource_snapshot())
+
+
+def new_trace(args):
+    return {
+        "kind": TRACE_KIND,
+        "started_at": datetime.now().isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "workers": args.workers,
+        "profile_dir": None,
+        "stages": [],
+        "languages": [],
+    }
+
+
+@contextmanager
+def trace_stage(trace, name, profile_dir=None):
+    """
+    Record wall/CPU time, peak RSS and I/O of a pipeline stage in trace.
+
+    Peak RSS is the process high-water mark at the end of the stage, so it
+    never drops between stages. With profile_dir set, the stage also runs
+    under cProfile and is dumped to <profile_dir>/<name>.prof.
+    """
+    stage = {"stage": name}
+    profiler = cProfile.Profile() if profile_dir else None
+    before = resource_snapshot()
+    if profiler:
+        profiler.enable()
+    try:
+        yield stage
+    finally:
+        if profiler:
+            profiler.disable()
+            stage["profile"] = os.path.join(profile_dir, f"{name}.prof")
+            os.makedirs(profile_dir, exist_ok=True)
+            profiler.dump_stats(stage["profile"])
+        stage.update(resource_delta(before, resource_snapshot()))
+        trace["stages"].append(stage)
+
+
+def write_trace(trace, path):
+    trace["finished_at"] = datetime.now().isoformat(timespec="seconds")
+    write_json(path, trace)
+
+
 def load_map_tx_module():
     module_path = os.path.join(SCRIPT_DIR, "map_tx.py")
     spec = importlib.util.spec_from_file_location("quran_tft_map_tx", module_path)
@@ -116,12 +221,17 @@ def selected_languages(args):
     return list(flattened.keys())
 
 
+def load_pull_module(pull_script):
+    spec = importlib.util.spec_from_file_location("quran_tft_pull_translations", pull_script)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
 def run_pull(args, raw_dir, reports_dir):
+    """Pull mapjson in-process and return the raw payloads keyed by language code."""
     pull_languages_file = write_pull_languages_file(args, reports_dir)
-    command = [
-        args.python,
-        "-u",
-        args.pull_script,
+    pull_args = [
         "--resource",
         "mapjson",
         "--raw-map-output-dir",
@@ -137,26 +247,48 @@ def run_pull(args, raw_dir, reports_dir):
         pull_languages_file,
     ]
     if args.lang:
-        command.extend(["--lang"] + args.lang)
+        pull_args.extend(["--lang"] + args.lang)
     if args.api_key_file:
-        command.extend(["--api-key-file", args.api_key_file])
+        pull_args.extend(["--api-key-file", args.api_key_file])
     if args.organization:
-        command.extend(["--organization", args.organization])
+        pull_args.extend(["--organization", args.organization])
     if args.project:
-        command.extend(["--project", args.project])
+        pull_args.extend(["--project", args.project])
     if args.poll_interval is not None:
-        command.extend(["--poll-interval", str(args.poll_interval)])
+        pull_args.extend(["--poll-interval", str(args.poll_interval)])
     if args.poll_timeout is not None:
-        command.extend(["--poll-timeout", str(args.poll_timeout)])
+        pull_args.extend(["--poll-timeout", str(args.poll_timeout)])
     if args.download_timeout is not None:
-        command.extend(["--download-timeout", str(args.download_timeout)])
+        pull_args.extend(["--download-timeout", str(args.download_timeout)])
+    if args.download_retries is not None:
+        pull_args.extend(["--download-retries", str(args.download_retries)])
+    if args.http_pool_size is not None:
+        pull_args.extend(["--http-pool-size", str(args.http_pool_size)])
 
     print("Pulling latest Transifex map translations...")
-    print(" ".join(command))
-    subprocess.run(command, check=True, cwd=REPO_ROOT)
+    print(" ".join([args.pull_script] + pull_args))
+    pull_module = load_pull_module(args.pull_script)
+    result = pull_module.pull(pull_args, collect_raw_maps=True)
+    return result["raw_maps"]
 
 
-def export_source(map_tx, source_path, manifest_path, source_upload_path, hash_length):
+def load_raw_payloads(raw_dir, languages=None):
+    """Read a raw map snapshot (map_<lang>.json files) into {lang: payload}."""
+    raw_files = sorted(
+        filename
+        for filename in os.listdir(raw_dir)
+        if filename.startswith("map_") and filename.endswith(".json")
+    )
+    if languages:
+        wanted = {f"map_{lang}.json" for lang in languages}
+        raw_files = [filename for filename in raw_files if filename in wanted]
+    return {
+        filename[len("map_"):-len(".json")]: load_json(os.path.join(raw_dir, filename))
+        for filename in raw_files
+    }
+
+
+def export_source(map_tx, source_path, manifest_path, source_upload_path, hash_length, binary_manifest_path=None):
     source_data = load_json(source_path)
     abs_source_path = os.path.abspath(source_path)
     try:
@@ -166,34 +298,23 @@ def export_source(map_tx, source_path, manifest_path, source_upload_path, hash_l
     source_flat, manifest = map_tx.build_export(source_data, source_label, hash_length)
     write_json(source_upload_path, source_flat, sort_keys=True)
     write_json(manifest_path, manifest)
-    return source_flat, manifest
+    if binary_manifest_path:
+        os.makedirs(os.path.dirname(os.path.abspath(binary_manifest_path)), exist_ok=True)
+        map_tx.write_binary_manifest(binary_manifest_path, manifest)
+    return source_data, source_flat, manifest
 
 
-def run_stability_check(args, report_path):
-    command = [
-        args.python,
-        os.path.join(SCRIPT_DIR, "map_tx.py"),
-        "stability-check",
-        args.source,
-        "--out",
-        report_path,
-        "--hash-length",
-        str(args.hash_length),
-    ]
+def run_stability_check(map_tx, source_data, manifest_index, args, report_path):
     print("Running stable key shift check...")
-    subprocess.run(command, check=True, cwd=REPO_ROOT)
-
-
-def bad_root_for_value(map_tx, value):
-    if not isinstance(value, str):
-        return True
-    levels, _ = map_tx.normalize_map_path(value.split("\n"))
-    return bool(levels and len(levels[0]) != 1)
-
-
-def normalized_path_parts(map_tx, value):
-    levels, _ = map_tx.normalize_map_path(value.split("\n"))
-    return levels, "\n".join(levels)
+    result = map_tx.check_key_stability(
+        source_data,
+        manifest_index.manifest,
+        args.source,
+        args.hash_length,
+        index=manifest_index,
+    )
+    map_tx.write_stability_report(result, report_path)
+    return result
 
 
 def load_icu_collator_classes():
@@ -216,23 +337,40 @@ def load_icu_collator_classes():
     return _COLLATOR_CLASSES
 
 
-def sort_dictionary(data, language_code):
+def collator_sort_key(language_code):
+    """
+    Memoized ICU sort key function, sharing one collator per locale. Sort keys
+    are kept for this process only because they are specific to the ICU build.
+    """
+    collator = _COLLATORS.get(language_code)
+    if collator is None:
+        Collator, Locale = load_icu_collator_classes()
+        collator = _COLLATORS[language_code] = Collator.createInstance(Locale(language_code))
+    memo = _SORT_KEY_MEMOS.setdefault(language_code, {})
+
+    def sort_key(value):
+        value = str(value)
+        key = memo.get(value)
+        if key is None:
+            key = memo[value] = collator.getSortKey(value)
+        return key
+
+    return sort_key
+
+
+def sort_dictionary(data, language_code, sort_key=None):
     if not isinstance(data, dict):
         return data
 
-    Collator, Locale = load_icu_collator_classes()
-    collator = Collator.createInstance(Locale(language_code))
-    sorted_items = sorted(data.items(), key=lambda item: collator.getSortKey(str(item[0])))
+    if sort_key is None:
+        sort_key = collator_sort_key(language_code)
+    sorted_items = sorted(data.items(), key=lambda item: sort_key(item[0]))
     return {
-        key: sort_dictionary(value, language_code)
+        key: sort_dictionary(value, language_code, sort_key)
         for key, value in sorted_items
     }
 
 
-def leaf_count(map_tx, data):
-    return sum(1 for _path, _reference in map_tx.walk_map(data))
-
-
 def bad_top_level_keys(map_tx, data):
     if not isinstance(data, dict):
         return ["<root-not-dict>"]
@@ -244,177 +382,274 @@ def bad_top_level_keys(map_tx, data):
     return bad_keys
 
 
-def prepare_targets(map_tx, raw_dir, stable_dir, reports_dir, source_flat, manifest, languages=None):
-    new_key_by_hash = {}
-    duplicate_hashes = []
-    for item in manifest["items"]:
-        tx_hash = tx_hash_from_key(item["key"])
-        if tx_hash in new_key_by_hash:
-            duplicate_hashes.append(tx_hash)
-        new_key_by_hash[tx_hash] = item["key"]
-    if duplicate_hashes:
-        raise ValueError(f"Duplicate source path hashes in new manifest: {duplicate_hashes[:5]}")
-
-    summary_rows = []
-    missing_fields = ["old_key", "old_hash", "raw_path"]
-    audit_fields = [
-        "old_key",
-        "new_key",
-        "action",
-        "reason",
-        "raw_path",
-        "normalized_path",
-        "new_source_path",
-        "normalized",
-    ]
-
-    raw_files = sorted(
-        filename
-        for filename in os.listdir(raw_dir)
-        if filename.startswith("map_") and filename.endswith(".json")
-    )
-    if languages:
-        wanted = {f"map_{lang}.json" for lang in languages}
-        raw_files = [filename for filename in raw_files if filename in wanted]
-    if not raw_files:
-        raise FileNotFoundError(f"No raw map JSON files found under {raw_dir}")
-
-    for filename in raw_files:
-        lang = filename[len("map_"):-len(".json")]
-        raw_path = os.path.join(raw_dir, filename)
-        raw_data = load_json(raw_path)
-        upload_data = {}
-        audit_rows = []
-        missing_rows = []
-        invalid_key_count = 0
-        blank_count = 0
-        source_match_count = 0
-        normalized_count = 0
-        non_string_count = 0
-        bad_root_count = 0
-        remapped_key_count = 0
-
-        for old_key in sorted(raw_data.keys()):
-            value = raw_data[old_key]
-            old_hash = tx_hash_from_key(old_key)
-            if old_hash is None:
-                invalid_key_count += 1
-                audit_rows.append({
-                    "old_key": old_key,
-                    "new_key": "",
-                    "action": "omit",
-                    "reason": "invalid_stable_key",
-                    "raw_path": value.replace("\n", " > ") if isinstance(value, str) else repr(value),
-                    "normalized_path": "",
-                    "new_source_path": "",
-                    "normalized": "",
-                })
-                continue
-
-            new_key = new_key_by_hash.get(old_hash)
-            if new_key is None:
-                missing_rows.append({
-                    "old_key": old_key,
-                    "old_hash": old_hash,
-                    "raw_path": value.replace("\n", " > ") if isinstance(value, str) else repr(value),
-                })
-                audit_rows.append({
-                    "old_key": old_key,
-                    "new_key": "",
-                    "action": "omit",
-                    "reason": "path_hash_missing_in_new_source",
-                    "raw_path": value.replace("\n", " > ") if isinstance(value, str) else repr(value),
-                    "normalized_path": "",
-                    "new_source_path": "",
-                    "normalized": "",
-                })
-                continue
+TARGET_MISSING_FIELDS = ["old_key", "old_hash", "raw_path"]
+TARGET_AUDIT_FIELDS = [
+    "old_key",
+    "new_key",
+    "action",
+    "reason",
+    "raw_path",
+    "normalized_path",
+    "new_source_path",
+    "normalized",
+]
+_TARGET_WORKER_STATE = {}
+
+
+def prepare_target_language(map_tx, lang, raw_data, stable_dir, reports_dir, source_flat, manifest_index):
+    """
+    Re-key one raw target payload and write its upload JSON and audit TSVs.
+
+    Returns the language's summary row, the upload-validation row for the
+    file it wrote, and the upload data itself for the local map update.
+    """
+    new_key_by_hash = manifest_index.key_by_hash
+    upload_data = {}
+    audit_rows = []
+    missing_rows = []
+    invalid_key_count = 0
+    blank_count = 0
+    source_match_count = 0
+    normalized_count = 0
+    non_string_count = 0
+    bad_root_count = 0
+    remapped_key_count = 0
+    upload_blank_count = 0
+    upload_extra_key_count = 0
+    normalized_values = map_tx.normalize_payload(raw_data)
+
+    for old_key in sorted(raw_data.keys()):
+        value = raw_data[old_key]
+        old_hash = tx_hash_from_key(old_key)
+        if old_hash is None:
+            invalid_key_count += 1
+            audit_rows.append({
+                "old_key": old_key,
+                "new_key": "",
+                "action": "omit",
+                "reason": "invalid_stable_key",
+                "raw_path": value.replace("\n", " > ") if isinstance(value, str) else repr(value),
+                "normalized_path": "",
+                "new_source_path": "",
+                "normalized": "",
+            })
+            continue
 
-            new_source_path = source_flat[new_key]
-            _, new_source_value = normalized_path_parts(map_tx, new_source_path)
-            if old_key != new_key:
-                remapped_key_count += 1
-            if not isinstance(value, str):
-                non_string_count += 1
-                audit_rows.append({
-                    "old_key": old_key,
-                    "new_key": new_key,
-                    "action": "omit",
-                    "reason": "non_string_value",
-                    "raw_path": repr(value),
-                    "normalized_path": "",
-                    "new_source_path": new_source_value.replace("\n", " > "),
-                    "normalized": "",
-                })
-                continue
-            if map_tx.is_blank_translation_value(value):
-                blank_count += 1
-                audit_rows.append({
-                    "old_key": old_key,
-                    "new_key": new_key,
-                    "action": "omit",
-                    "reason": "blank_translation_value",
-                    "raw_path": value.replace("\n", " > "),
-                    "normalized_path": "",
-                    "new_source_path": new_source_value.replace("\n", " > "),
-                    "normalized": "",
-                })
-                continue
+        new_key = new_key_by_hash.get(old_hash)
+        if new_key is None:
+            missing_rows.append({
+                "old_key": old_key,
+                "old_hash": old_hash,
+                "raw_path": value.replace("\n", " > ") if isinstance(value, str) else repr(value),
+            })
+            audit_rows.append({
+                "old_key": old_key,
+                "new_key": "",
+                "action": "omit",
+                "reason": "path_hash_missing_in_new_source",
+                "raw_path": value.replace("\n", " > ") if isinstance(value, str) else repr(value),
+                "normalized_path": "",
+                "new_source_path": "",
+                "normalized": "",
+            })
+            continue
 
-            normalized_path, normalized = map_tx.normalize_map_path(value.split("\n"))
-            normalized_value = "\n".join(normalized_path)
-            if normalized:
-                normalized_count += 1
-            if normalized_value == new_source_value:
-                source_match_count += 1
-                audit_rows.append({
-                    "old_key": old_key,
-                    "new_key": new_key,
-                    "action": "omit",
-                    "reason": "matches_new_source_path",
-                    "raw_path": value.replace("\n", " > "),
-                    "normalized_path": normalized_value.replace("\n", " > "),
-                    "new_source_path": new_source_value.replace("\n", " > "),
-                    "normalized": str(bool(normalized)).lower(),
-                })
-                continue
+        new_source_value = map_tx.normalize_map_value(source_flat[new_key]).value
+        if old_key != new_key:
+            remapped_key_count += 1
+        if not isinstance(value, str):
+            non_string_count += 1
+            audit_rows.append({
+                "old_key": old_key,
+                "new_key": new_key,
+                "action": "omit",
+                "reason": "non_string_value",
+                "raw_path": repr(value),
+                "normalized_path": "",
+                "new_source_path": new_source_value.replace("\n", " > "),
+                "normalized": "",
+            })
+            continue
+        normalized_entry = normalized_values[old_key]
+        if normalized_entry.blank:
+            blank_count += 1
+            audit_rows.append({
+                "old_key": old_key,
+                "new_key": new_key,
+                "action": "omit",
+                "reason": "blank_translation_value",
+                "raw_path": value.replace("\n", " > "),
+                "normalized_path": "",
+                "new_source_path": new_source_value.replace("\n", " > "),
+                "normalized": "",
+            })
+            continue
 
-            if bad_root_for_value(map_tx, normalized_value):
-                bad_root_count += 1
-            upload_data[new_key] = normalized_value
+        normalized_path = normalized_entry.levels
+        normalized_value = normalized_entry.value
+        normalized = normalized_entry.normalized
+        if normalized:
+            normalized_count += 1
+        if normalized_value == new_source_value:
+            source_match_count += 1
             audit_rows.append({
                 "old_key": old_key,
                 "new_key": new_key,
-                "action": "write",
-                "reason": "",
+                "action": "omit",
+                "reason": "matches_new_source_path",
                 "raw_path": value.replace("\n", " > "),
                 "normalized_path": normalized_value.replace("\n", " > "),
                 "new_source_path": new_source_value.replace("\n", " > "),
                 "normalized": str(bool(normalized)).lower(),
             })
+            continue
 
-        upload_path = os.path.join(stable_dir, f"map_{lang}.json")
-        audit_path = os.path.join(reports_dir, f"{lang}_target_rekey_audit.tsv")
-        missing_path = os.path.join(reports_dir, f"{lang}_missing_path_hashes.tsv")
-        write_json(upload_path, upload_data, sort_keys=True)
-        write_tsv(audit_path, audit_rows, audit_fields)
-        write_tsv(missing_path, missing_rows, missing_fields)
-
-        summary_rows.append({
-            "lang": lang,
-            "raw_keys": len(raw_data),
-            "upload_keys": len(upload_data),
-            "missing_path_hashes": len(missing_rows),
-            "invalid_stable_keys": invalid_key_count,
-            "blank_values": blank_count,
-            "source_matches_omitted": source_match_count,
-            "normalized_values": normalized_count,
-            "reference_key_remaps": remapped_key_count,
-            "bad_roots_written": bad_root_count,
-            "non_string_values": non_string_count,
-            "upload_file": upload_path,
+        # normalize_map_path() is idempotent, so the checks validate_uploads()
+        # would repeat on the written file are made here on normalized_path.
+        if normalized_path and len(normalized_path[0]) != 1:
+            bad_root_count += 1
+        if not normalized_path:
+            upload_blank_count += 1
+        if new_key not in manifest_index.keys:
+            upload_extra_key_count += 1
+        upload_data[new_key] = normalized_value
+        audit_rows.append({
+            "old_key": old_key,
+            "new_key": new_key,
+            "action": "write",
+            "reason": "",
+            "raw_path": value.replace("\n", " > "),
+            "normalized_path": normalized_value.replace("\n", " > "),
+            "new_source_path": new_source_value.replace("\n", " > "),
+            "normalized": str(bool(normalized)).lower(),
         })
 
+    upload_path = os.path.join(stable_dir, f"map_{lang}.json")
+    audit_path = os.path.join(reports_dir, f"{lang}_target_rekey_audit.tsv")
+    missing_path = os.path.join(reports_dir, f"{lang}_missing_path_hashes.tsv")
+    write_json(upload_path, upload_data, sort_keys=True)
+    write_tsv(audit_path, audit_rows, TARGET_AUDIT_FIELDS)
+    write_tsv(missing_path, missing_rows, TARGET_MISSING_FIELDS)
+
+    validation_row = {
+        "file": upload_path,
+        "keys": len(upload_data),
+        "extra_keys": upload_extra_key_count,
+        "blank_values": upload_blank_count,
+        # Values equal to the new source path and non-string values are omitted above.
+        "source_matches": 0,
+        "bad_roots": bad_root_count,
+        "non_string_values": 0,
+    }
+    summary_row = {
+        "lang": lang,
+        "raw_keys": len(raw_data),
+        "upload_keys": len(upload_data),
+        "missing_path_hashes": len(missing_rows),
+        "invalid_stable_keys": invalid_key_count,
+        "blank_values": blank_count,
+        "source_matches_omitted": source_match_count,
+        "normalized_values": normalized_count,
+        "reference_key_remaps": remapped_key_count,
+        "bad_roots_written": bad_root_count,
+        "non_string_values": non_string_count,
+        "upload_file": upload_path,
+    }
+    return summary_row, validation_row, upload_data
+
+
+def init_target_worker(source_flat, manifest, stable_dir, reports_dir, profile_dir=None):
+    map_tx = load_map_tx_module()
+    _TARGET_WORKER_STATE.update({
+        "map_tx": map_tx,
+        "source_flat": source_flat,
+        "manifest_index": map_tx.ManifestIndex(manifest),
+        "stable_dir": stable_dir,
+        "reports_dir": reports_dir,
+        "profile_dir": profile_dir,
+    })
+
+
+def prepare_target_in_worker(lang, raw_data):
+    state = _TARGET_WORKER_STATE
+    # The parent's stage profile cannot see into workers, so each language gets its own dump.
+    profile_path = None
+    if state["profile_dir"]:
+        profile_path = os.path.join(state["profile_dir"], f"rekey-{lang}.prof")
+    return measured_call(
+        prepare_target_language,
+        state["map_tx"],
+        lang,
+        raw_data,
+        state["stable_dir"],
+        state["reports_dir"],
+        state["source_flat"],
+        state["manifest_index"],
+        profile_path=profile_path,
+    )
+
+
+def prepare_targets(
+    map_tx,
+    raw_payloads,
+    stable_dir,
+    reports_dir,
+    source_flat,
+    manifest_index,
+    languages=None,
+    workers=1,
+    trace=None,
+    profile_dir=None,
+):
+    if manifest_index.duplicate_hashes:
+        raise ValueError(f"Duplicate source path hashes in new manifest: {manifest_index.duplicate_hashes[:5]}")
+
+    raw_langs = sorted(raw_payloads)
+    if languages:
+        wanted = set(languages)
+        raw_langs = [lang for lang in raw_langs if lang in wanted]
+    if not raw_langs:
+        raise FileNotFoundError("No raw map payloads to prepare")
+
+    workers = min(workers, len(raw_langs))
+    if workers > 1:
+        # Each worker builds its own manifest index once; only raw payloads and
+        # summary rows cross the process boundary. map() keeps language order.
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=init_target_worker,
+            initargs=(source_flat, manifest_index.manifest, stable_dir, reports_dir, profile_dir),
+        ) as executor:
+            measured = list(executor.map(
+                prepare_target_in_worker,
+                raw_langs,
+                [raw_payloads[lang] for lang in raw_langs],
+            ))
+    else:
+        measured = [
+            measured_call(
+                prepare_target_language,
+                map_tx,
+                lang,
+                raw_payloads[lang],
+                stable_dir,
+                reports_dir,
+                source_flat,
+                manifest_index,
+            )
+            for lang in raw_langs
+        ]
+    results = [result for result, _usage in measured]
+    if trace is not None:
+        for lang, (_result, usage) in zip(raw_langs, measured):
+            trace["languages"].append({"stage": "rekey", "lang": lang, **usage})
+    summary_rows = [summary_row for summary_row, _validation_row, _upload_data in results]
+    validation_rows = [validation_row for _summary_row, validation_row, _upload_data in results]
+    uploads = {
+        summary_row["lang"]: upload_data
+        for summary_row, _validation_row, upload_data in results
+    }
+
     summary_fields = [
         "lang",
         "raw_keys",
@@ -431,17 +666,41 @@ def prepare_targets(map_tx, raw_dir, stable_dir, reports_dir, source_flat, manif
     ]
     summary_path = os.path.join(reports_dir, "target-rekey-summary.tsv")
     write_tsv(summary_path, summary_rows, summary_fields)
-    return summary_rows, summary_path
+    return summary_rows, summary_path, validation_rows, uploads
+
+
+VALIDATION_FIELDS = [
+    "file",
+    "keys",
+    "extra_keys",
+    "blank_values",
+    "source_matches",
+    "bad_roots",
+    "non_string_values",
+]
+
+
+def upload_files_from(paths):
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(
+                os.path.join(path, filename)
+                for filename in sorted(os.listdir(path))
+                if filename.startswith("map_") and filename.endswith(".json")
+            )
+        else:
+            files.append(path)
+    return files
 
 
-def validate_uploads(map_tx, stable_dir, source_flat, manifest):
-    manifest_keys = {item["key"] for item in manifest["items"]}
+def validate_uploads(map_tx, upload_paths, source_flat, manifest_index):
+    """Re-validate upload files supplied from outside this run (see --validate-upload)."""
+    manifest_keys = manifest_index.keys
     rows = []
-    for filename in sorted(os.listdir(stable_dir)):
-        if not filename.startswith("map_") or not filename.endswith(".json"):
-            continue
-        path = os.path.join(stable_dir, filename)
+    for path in upload_files_from(upload_paths):
         data = load_json(path)
+        normalized_values = map_tx.normalize_payload(data)
         blank_count = 0
         source_match_count = 0
         bad_root_count = 0
@@ -454,15 +713,15 @@ def validate_uploads(map_tx, stable_dir, source_flat, manifest):
             if not isinstance(value, str):
                 non_string_count += 1
                 continue
-            if map_tx.is_blank_translation_value(value):
+            normalized_entry = normalized_values[key]
+            if normalized_entry.blank:
                 blank_count += 1
-            normalized_path, _ = map_tx.normalize_map_path(value.split("\n"))
-            normalized_value = "\n".join(normalized_path)
+            normalized_path = normalized_entry.levels
             source_value = source_flat.get(key)
             source_normalized_value = None
             if isinstance(source_value, str):
-                _, source_normalized_value = normalized_path_parts(map_tx, source_value)
-            if normalized_value == source_normalized_value:
+                source_normalized_value = map_tx.normalize_map_value(source_value).value
+            if normalized_entry.value == source_normalized_value:
                 source_match_count += 1
             if normalized_path and len(normalized_path[0]) != 1:
                 bad_root_count += 1
@@ -479,17 +738,62 @@ def validate_uploads(map_tx, stable_dir, source_flat, manifest):
     return rows
 
 
-def update_local_maps(map_tx, stable_dir, local_output_dir, reports_dir, manifest, languages):
+def validation_failures(rows):
+    return [
+        row
+        for row in rows
+        if (
+            row["extra_keys"]
+            or row["blank_values"]
+            or row["source_matches"]
+            or row["bad_roots"]
+            or row["non_string_values"]
+        )
+    ]
+
+
+def revalidate_uploads(args):
+    """--validate-upload: check external upload files against the current source map."""
+    map_tx = load_map_tx_module()
+    source_data = load_json(args.source)
+    source_flat, manifest = map_tx.build_export(source_data, args.source, args.hash_length)
+    rows = validate_uploads(map_tx, args.validate_upload, source_flat, map_tx.ManifestIndex(manifest))
+    if not rows:
+        raise FileNotFoundError("No upload JSON files found to validate")
+
+    reports_dir = os.path.join(args.out_dir or default_out_dir(), "reports")
+    validation_path = os.path.join(reports_dir, "upload-validation.tsv")
+    write_tsv(validation_path, rows, VALIDATION_FIELDS)
+
+    failures = validation_failures(rows)
+    for row in rows:
+        print(f"{row['file']}: {row['keys']} keys")
+    print(f"\nValidation: {validation_path}")
+    if failures:
+        print(f"\nUpload validation failures: {len(failures)}")
+        return 2
+    return 0
+
+
+def update_local_maps(map_tx, uploads, local_output_dir, reports_dir, manifest_index, languages, trace=None):
+    """Rebuild local client maps from the in-memory upload data of the re-key stage."""
     rows = []
     fields = ["lang", "output_file", "upload_keys", "leaf_count", "bad_top_level_count", "bad_top_level_sample"]
 
     for lang in languages:
-        stable_path = os.path.join(stable_dir, f"map_{lang}.json")
-        if not os.path.exists(stable_path):
+        flat_data = uploads.get(lang)
+        if flat_data is None:
             continue
 
-        flat_data = load_json(stable_path)
-        reconstructed = map_tx.reconstruct_map(flat_data, manifest, fallback_to_source=True)
+        before = resource_snapshot()
+        stats = {}
+        reconstructed = map_tx.reconstruct_map(
+            flat_data,
+            manifest_index.manifest,
+            fallback_to_source=True,
+            index=manifest_index,
+            stats=stats,
+        )
         sorted_map = sort_dictionary(reconstructed, lang)
 
         output_path = os.path.join(local_output_dir, lang, f"map_{lang}.json")
@@ -499,10 +803,16 @@ def update_local_maps(map_tx, stable_dir, local_output_dir, reports_dir, manifes
             "lang": lang,
             "output_file": output_path,
             "upload_keys": len(flat_data),
-            "leaf_count": leaf_count(map_tx, sorted_map),
+            "leaf_count": stats["leaf_count"],
             "bad_top_level_count": len(bad_keys),
             "bad_top_level_sample": "; ".join(str(key) for key in bad_keys[:5]),
         })
+        if trace is not None:
+            trace["languages"].append({
+                "stage": "local_update",
+                "lang": lang,
+                **resource_delta(before, resource_snapshot()),
+            })
 
     summary_path = os.path.join(reports_dir, "local-map-update-summary.tsv")
     write_tsv(summary_path, rows, fields)
@@ -532,6 +842,7 @@ Output layout:
   <out-dir>/stable/map_<lang>.json       Upload these to target languages.
   <out-dir>/raw-before/map_<lang>.json   Raw target snapshot before source replace.
   <out-dir>/reports/*.tsv                Audits and missing-hash reports.
+  <out-dir>/reports/stage-trace.json     Per-stage and per-language time, memory and I/O.
   app/src/assets/translations/<lang>/map_<lang>.json
                                        Updated local client maps by default.
 
@@ -550,6 +861,11 @@ Version control:
             f"Default: {DEFAULT_MANIFEST}"
         ),
     )
+    parser.add_argument(
+        "--binary-manifest",
+        metavar="PATH",
+        help="Also write the regenerated manifest in the compact binary form (see map_tx.py pack-manifest).",
+    )
     parser.add_argument(
         "--out-dir",
         default=None,
@@ -581,87 +897,98 @@ Version control:
     parser.add_argument("--poll-interval", type=float, help="Pull polling interval in seconds.")
     parser.add_argument("--poll-timeout", type=float, help="Pull polling timeout in seconds.")
     parser.add_argument("--download-timeout", type=float, help="Pull download timeout in seconds.")
+    parser.add_argument("--download-retries", type=int, help="Pull download retries on connection errors and 429/5xx responses.")
+    parser.add_argument("--http-pool-size", type=int, help="Pull keep-alive connections per host.")
     parser.add_argument("--verbosity", choices=["quiet", "normal", "debug"], default="normal", help="Pull logging detail. Default: normal.")
+    parser.add_argument(
+        "--validate-upload",
+        nargs="+",
+        metavar="PATH",
+        help=(
+            "Only re-validate existing upload JSON files (or directories of map_<lang>.json) "
+            "against --source, writing <out-dir>/reports/upload-validation.tsv. Uploads "
+            "prepared by this script are validated while they are generated."
+        ),
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Processes used to re-key target languages in parallel. Default: 1.",
+    )
     parser.add_argument("--hash-length", type=int, default=40, help="Stable path hash length. Default: 40.")
-    parser.add_argument("--python", default=DEFAULT_PYTHON, help=f"Python executable. Default: {DEFAULT_PYTHON}")
+    parser.add_argument(
+        "--hash-cache",
+        action="store_true",
+        help="Reuse path hashes from the persistent cache next to --manifest and add new ones to it.",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Run each stage under cProfile and write <out-dir>/reports/profile/<stage>.prof dumps.",
+    )
     parser.add_argument("--pull-script", default=DEFAULT_PULL_SCRIPT, help=f"pull_translations.py path. Default: {DEFAULT_PULL_SCRIPT}")
     return parser
 
 
-def main():
-    if hasattr(sys.stdout, "reconfigure"):
-        sys.stdout.reconfigure(line_buffering=True)
-
-    parser = build_parser()
-    args = parser.parse_args()
-    if args.skip_pull and not args.raw_dir:
-        parser.error("--skip-pull requires --raw-dir")
-
-    out_dir = args.out_dir or default_out_dir()
-    raw_dir = args.raw_dir or os.path.join(out_dir, "raw-before")
-    stable_dir = os.path.join(out_dir, "stable")
-    reports_dir = os.path.join(out_dir, "reports")
-    languages = selected_languages(args)
-    os.makedirs(raw_dir, exist_ok=True)
-    os.makedirs(stable_dir, exist_ok=True)
-    os.makedirs(reports_dir, exist_ok=True)
-
+def run_update(args, raw_dir, stable_dir, reports_dir, languages, trace, profile_dir=None):
     if not args.skip_pull:
-        run_pull(args, raw_dir, reports_dir)
+        with trace_stage(trace, "pull", profile_dir):
+            raw_payloads = run_pull(args, raw_dir, reports_dir)
     else:
         print(f"Using existing raw map snapshot: {raw_dir}")
+        with trace_stage(trace, "load_raw", profile_dir):
+            raw_payloads = load_raw_payloads(raw_dir, languages)
+        if not raw_payloads:
+            raise FileNotFoundError(f"No raw map JSON files found under {raw_dir}")
 
     map_tx = load_map_tx_module()
+    hash_cache_path = map_tx.path_hash_cache_path_for(args.manifest)
+    if args.hash_cache:
+        map_tx.load_path_hash_cache(hash_cache_path)
     source_upload_path = os.path.join(stable_dir, "source_map.json")
-    source_flat, manifest = export_source(
-        map_tx=map_tx,
-        source_path=args.source,
-        manifest_path=args.manifest,
-        source_upload_path=source_upload_path,
-        hash_length=args.hash_length,
-    )
+    with trace_stage(trace, "export", profile_dir):
+        source_data, source_flat, manifest = export_source(
+            map_tx=map_tx,
+            source_path=args.source,
+            manifest_path=args.manifest,
+            source_upload_path=source_upload_path,
+            hash_length=args.hash_length,
+            binary_manifest_path=args.binary_manifest,
+        )
     print(f"Exported source upload: {source_upload_path}")
     print(f"Updated manifest:       {args.manifest}")
+    if args.binary_manifest:
+        print(f"Binary manifest:        {args.binary_manifest}")
 
     stability_report = os.path.join(reports_dir, "source-stability-check.json")
-    run_stability_check(args, stability_report)
-
-    summary_rows, summary_path = prepare_targets(
-        map_tx=map_tx,
-        raw_dir=raw_dir,
-        stable_dir=stable_dir,
-        reports_dir=reports_dir,
-        source_flat=source_flat,
-        manifest=manifest,
-        languages=languages,
-    )
-    validation_rows = validate_uploads(map_tx, stable_dir, source_flat, manifest)
-    validation_path = os.path.join(reports_dir, "upload-validation.tsv")
-    write_tsv(
-        validation_path,
-        validation_rows,
-        [
-            "file",
-            "keys",
-            "extra_keys",
-            "blank_values",
-            "source_matches",
-            "bad_roots",
-            "non_string_values",
-        ],
-    )
-
-    failures = [
-        row
-        for row in validation_rows
-        if (
-            row["extra_keys"]
-            or row["blank_values"]
-            or row["source_matches"]
-            or row["bad_roots"]
-            or row["non_string_values"]
+    with trace_stage(trace, "stability_check", profile_dir):
+        manifest_index = map_tx.ManifestIndex(manifest)
+        stability_result = run_stability_check(map_tx, source_data, manifest_index, args, stability_report)
+    if args.hash_cache:
+        map_tx.save_path_hash_cache(hash_cache_path)
+    if stability_result["failures"]:
+        print("\nSource stability check failed; fix the key shifts before preparing uploads.")
+        return 1
+
+    with trace_stage(trace, "rekey", profile_dir):
+        summary_rows, summary_path, validation_rows, uploads = prepare_targets(
+            map_tx=map_tx,
+            raw_payloads=raw_payloads,
+            stable_dir=stable_dir,
+            reports_dir=reports_dir,
+            source_flat=source_flat,
+            manifest_index=manifest_index,
+            languages=languages,
+            workers=args.workers,
+            trace=trace,
+            profile_dir=profile_dir,
         )
-    ]
+    with trace_stage(trace, "validation", profile_dir):
+        validation_path = os.path.join(reports_dir, "upload-validation.tsv")
+        write_tsv(validation_path, validation_rows, VALIDATION_FIELDS)
+        failures = validation_failures(validation_rows)
+
     missing_total = sum(row["missing_path_hashes"] for row in summary_rows)
     invalid_total = sum(row["invalid_stable_keys"] for row in summary_rows)
     bad_local_total = 0
@@ -693,14 +1020,16 @@ def main():
     if args.no_local_update:
         print("\nLocal client map update skipped (--no-local-update).")
     else:
-        local_rows, local_summary_path = update_local_maps(
-            map_tx=map_tx,
-            stable_dir=stable_dir,
-            local_output_dir=args.local_output_dir,
-            reports_dir=reports_dir,
-            manifest=manifest,
-            languages=[row["lang"] for row in summary_rows],
-        )
+        with trace_stage(trace, "local_update", profile_dir):
+            local_rows, local_summary_path = update_local_maps(
+                map_tx=map_tx,
+                uploads=uploads,
+                local_output_dir=args.local_output_dir,
+                reports_dir=reports_dir,
+                manifest_index=manifest_index,
+                languages=[row["lang"] for row in summary_rows],
+                trace=trace,
+            )
         bad_local_total = sum(row["bad_top_level_count"] for row in local_rows)
         print("\nUpdated local client map files:")
         for row in local_rows:
@@ -725,5 +1054,40 @@ def main():
     return 0
 
 
+def main():
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=True)
+
+    parser = build_parser()
+    args = parser.parse_args()
+    if args.skip_pull and not args.raw_dir:
+        parser.error("--skip-pull requires --raw-dir")
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.validate_upload:
+        return revalidate_uploads(args)
+
+    out_dir = args.out_dir or default_out_dir()
+    raw_dir = args.raw_dir or os.path.join(out_dir, "raw-before")
+    stable_dir = os.path.join(out_dir, "stable")
+    reports_dir = os.path.join(out_dir, "reports")
+    languages = selected_languages(args)
+    os.makedirs(raw_dir, exist_ok=True)
+    os.makedirs(stable_dir, exist_ok=True)
+    os.makedirs(reports_dir, exist_ok=True)
+
+    trace = new_trace(args)
+    trace_path = os.path.join(reports_dir, "stage-trace.json")
+    profile_dir = os.path.join(reports_dir, "profile") if args.profile else None
+    trace["profile_dir"] = profile_dir
+    try:
+        return run_update(args, raw_dir, stable_dir, reports_dir, languages, trace, profile_dir)
+    finally:
+        write_trace(trace, trace_path)
+        print(f"\nStage trace: {trace_path}")
+        if profile_dir:
+            print(f"Profiles:    {profile_dir}")
+
+
 if __name__ == "__main__":
     sys.exit(main())
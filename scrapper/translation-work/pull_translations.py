@@ -2,8 +2,17 @@ import os
 import argparse
 import sys
 import time
+import threading
+import json
+import re
+import subprocess
+import hashlib
+import heapq
+import tempfile
+import importlib.util
+import random
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
-# --- CLI argument parsing (before heavy imports so --help always works) ---
 ALL_RESOURCE_SLUGS = [
     'coverjson',
     'introductionjson',
@@ -13,10 +22,47 @@ ALL_RESOURCE_SLUGS = [
     'mapjson'
 ]
 
-parser = argparse.ArgumentParser(
-    description='Pull translations from Transifex and optionally commit changes.',
-    formatter_class=argparse.RawDescriptionHelpFormatter,
-    epilog="""examples:
+# Determine the directory where this script is located.
+script_dir = os.path.dirname(os.path.abspath(__file__))
+map_work_dir = os.path.normpath(os.path.join(script_dir, "../map-work"))
+default_map_manifest_path = os.path.join(map_work_dir, "map_tx_manifest.json")
+
+# Heavy dependencies, each loaded by the subsystem that needs it: the Transifex
+# client by configure(), requests/tx_http by the first download, and ICU only
+# when a payload is actually sorted.
+transifex_api = None
+requests = None
+Collator = None
+Locale = None
+tx_http = None
+
+# Per-run state, set up by configure() from the parsed command line.
+args = None
+map_manifest_path = None
+fingerprint_path = None
+http_session = None
+http_session_lock = threading.Lock()
+import_timings = {}
+organization_slug = None
+project_slug = None
+resource_slugs = None
+language_codes = None
+language_names = None
+language_settings = None
+project = None
+project_resources = None
+project_languages = None
+base_path = None
+fingerprints = {}
+fingerprints_changed = False
+collected_raw_maps = None
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description='Pull translations from Transifex and optionally commit changes.',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""examples:
   %(prog)s                                  # pull all languages, all resources (original behavior)
   %(prog)s --lang tr                        # pull only Turkish
   %(prog)s --lang tr de                     # pull Turkish and German
@@ -31,108 +77,180 @@ parser = argparse.ArgumentParser(
   %(prog)s --raw-map-output-dir /tmp/raw-maps # also save raw Transifex mapjson payloads
   %(prog)s --raw-map-only --resource mapjson # save raw mapjson payloads without reconstructing local maps
   %(prog)s --map-manifest /path/to/manifest.json # stable-key map manifest
+  %(prog)s --jobs 8                         # run up to 8 Transifex exports concurrently
+  %(prog)s --metadata-cache /tmp/tx-meta.json # reuse Transifex resource/language ids between runs
+  %(prog)s --force                          # re-download resources even if fingerprints say unchanged
   %(prog)s --api-key-file /path/to/key      # use a custom API key file
   %(prog)s --output-dir /path/to/dir        # save translations to a custom directory
   %(prog)s --languages-file /path/to/file   # use a custom supported-languages.json file
 """)
-parser.add_argument('--lang', nargs='+', metavar='CODE',
-                    help='Language code(s) to pull (e.g. tr de ru). Default: all supported languages.')
-parser.add_argument('--resource', nargs='+', metavar='SLUG', choices=ALL_RESOURCE_SLUGS,
-                    help=f'Resource slug(s) to pull. Choices: {", ".join(ALL_RESOURCE_SLUGS)}. Default: all.')
-parser.add_argument('--no-commit', action='store_true',
-                    help='Pull and stage changes but skip the commit prompt.')
-parser.add_argument('--no-stage', action='store_true',
-                    help='Pull and write files but do not stage or commit (review only).')
-parser.add_argument('--dry-run', action='store_true',
-                    help='Show what would be done without writing any files.')
-parser.add_argument('--assume-yes', '--asume-yes', action='store_true',
-                    help='Automatically commit staged changes without asking for confirmation.')
-parser.add_argument('--skip-completeness', action='store_true',
-                    help='Skip updating completeness percentages in languages.json.')
-parser.add_argument('--api-key-file', metavar='PATH',
-                    help='Path to the Transifex API key file. Default: transifex-api-key in script dir.')
-parser.add_argument('--output-dir', metavar='PATH',
-                    help='Base directory for saving translations. Default: ../../app/src/assets/translations')
-parser.add_argument('--languages-file', metavar='PATH',
-                    help='Path to supported-languages.json. Default: supported-languages.json in script dir.')
-parser.add_argument('--organization', default='submittertech', metavar='SLUG',
-                    help='Transifex organization slug. Default: submittertech')
-parser.add_argument('--project', default='quranthefinaltestament', metavar='SLUG',
-                    help='Transifex project slug. Default: quranthefinaltestament')
-parser.add_argument('--poll-interval', type=float, default=2.0, metavar='SECONDS',
-                    help='Seconds between async download status checks. Default: 2')
-parser.add_argument('--poll-timeout', type=float, default=300.0, metavar='SECONDS',
-                    help='Maximum seconds to wait for a Transifex async download. Default: 300')
-parser.add_argument('--download-timeout', type=float, default=120.0, metavar='SECONDS',
-                    help='Read timeout in seconds for the final file download. Default: 120')
-parser.add_argument('--translation-mode', default='default', metavar='MODE',
-                    help=(
-                        'Transifex translation download mode. Use "onlytranslated" to include '
-                        'translated/reviewed/proofread strings and omit untranslated strings. '
-                        'Default: default'
-                    ))
-parser.add_argument('--raw-map-output-dir', metavar='PATH',
-                    help=(
-                        'Optional directory for raw mapjson key-value payloads downloaded '
-                        'from Transifex before legacy reconstruction.'
-                    ))
-parser.add_argument('--raw-map-only', action='store_true',
-                    help=(
-                        'For mapjson resources, save the raw Transifex payload and skip '
-                        'legacy reconstruction/output. Requires --raw-map-output-dir.'
-                    ))
-parser.add_argument('--map-manifest', metavar='PATH',
-                    help=(
-                        'Stable-key map manifest path. Default: ../map-work/map_tx_manifest.json. '
-                        'Used automatically when downloaded mapjson keys match the stable format.'
-                    ))
-parser.add_argument('--verbosity', choices=['quiet', 'normal', 'debug'], default='normal',
-                    help='Logging detail for async download steps. Default: normal')
-
-args = parser.parse_args()
-if args.raw_map_only and not args.raw_map_output_dir:
-    parser.error('--raw-map-only requires --raw-map-output-dir')
-
-# --- Heavy imports (after argparse so --help works without dependencies) ---
-import ctypes
-
-# Path to your Homebrew ICU 76 libraries (adjust if using Apple Silicon)
-icu_lib_path = "/usr/local/opt/icu4c@76/lib"
-
-# Explicitly load the necessary ICU libraries into the global namespace.
-# This forces the dynamic linker to use these libraries instead of the system ICU.
-for lib_name in ["libicuuc.76.dylib", "libicui18n.76.dylib", "libicudata.76.dylib"]:
-    lib_path = os.path.join(icu_lib_path, lib_name)
-    print(f"Loading ICU library: {lib_path}")
-    ctypes.CDLL(lib_path, mode=ctypes.RTLD_GLOBAL)
-
-from transifex.api import transifex_api
-import requests
-import json
-import re
-import subprocess
-import importlib.util
-from icu import Collator, Locale
-
-# Determine the directory where this script is located.
-script_dir = os.path.dirname(os.path.abspath(__file__))
-map_work_dir = os.path.normpath(os.path.join(script_dir, "../map-work"))
-default_map_manifest_path = os.path.join(map_work_dir, "map_tx_manifest.json")
-map_manifest_path = args.map_manifest or default_map_manifest_path
+    parser.add_argument('--lang', nargs='+', metavar='CODE',
+                        help='Language code(s) to pull (e.g. tr de ru). Default: all supported languages.')
+    parser.add_argument('--resource', nargs='+', metavar='SLUG', choices=ALL_RESOURCE_SLUGS,
+                        help=f'Resource slug(s) to pull. Choices: {", ".join(ALL_RESOURCE_SLUGS)}. Default: all.')
+    parser.add_argument('--no-commit', action='store_true',
+                        help='Pull and stage changes but skip the commit prompt.')
+    parser.add_argument('--no-stage', action='store_true',
+                        help='Pull and write files but do not stage or commit (review only).')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='Show what would be done without writing any files.')
+    parser.add_argument('--assume-yes', '--asume-yes', action='store_true',
+                        help='Automatically commit staged changes without asking for confirmation.')
+    parser.add_argument('--skip-completeness', action='store_true',
+                        help='Skip updating completeness percentages in languages.json.')
+    parser.add_argument('--api-key-file', metavar='PATH',
+                        help='Path to the Transifex API key file. Default: transifex-api-key in script dir.')
+    parser.add_argument('--output-dir', metavar='PATH',
+                        help='Base directory for saving translations. Default: ../../app/src/assets/translations')
+    parser.add_argument('--languages-file', metavar='PATH',
+                        help='Path to supported-languages.json. Default: supported-languages.json in script dir.')
+    parser.add_argument('--organization', default='submittertech', metavar='SLUG',
+                        help='Transifex organization slug. Default: submittertech')
+    parser.add_argument('--project', default='quranthefinaltestament', metavar='SLUG',
+                        help='Transifex project slug. Default: quranthefinaltestament')
+    parser.add_argument('--poll-interval', type=float, default=2.0, metavar='SECONDS',
+                        help=(
+                            'Initial seconds between async download status checks. Each job backs off '
+                            'exponentially (with jitter) from here. Default: 2'
+                        ))
+    parser.add_argument('--poll-max-interval', type=float, default=15.0, metavar='SECONDS',
+                        help='Upper bound for the per-job status check backoff. Default: 15')
+    parser.add_argument('--poll-timeout', type=float, default=300.0, metavar='SECONDS',
+                        help='Maximum seconds to wait for a Transifex async download. Default: 300')
+    parser.add_argument('--download-timeout', type=float, default=120.0, metavar='SECONDS',
+                        help='Read timeout in seconds for the final file download. Default: 120')
+    parser.add_argument('--download-retries', type=int, default=3, metavar='N',
+                        help='Retries for export file downloads on connection errors and 429/5xx responses. Default: 3')
+    parser.add_argument('--download-backoff', type=float, default=0.5, metavar='SECONDS',
+                        help='Base delay of the exponential download retry backoff. Default: 0.5')
+    parser.add_argument('--http-pool-size', type=int, metavar='N',
+                        help='Maximum pooled keep-alive connections per host for downloads. Default: max(--jobs, 4)')
+    parser.add_argument('--translation-mode', default='default', metavar='MODE',
+                        help=(
+                            'Transifex translation download mode. Use "onlytranslated" to include '
+                            'translated/reviewed/proofread strings and omit untranslated strings. '
+                            'Default: default'
+                        ))
+    parser.add_argument('--raw-map-output-dir', metavar='PATH',
+                        help=(
+                            'Optional directory for raw mapjson key-value payloads downloaded '
+                            'from Transifex before legacy reconstruction.'
+                        ))
+    parser.add_argument('--raw-map-only', action='store_true',
+                        help=(
+                            'For mapjson resources, save the raw Transifex payload and skip '
+                            'legacy reconstruction/output. Requires --raw-map-output-dir.'
+                        ))
+    parser.add_argument('--map-manifest', metavar='PATH',
+                        help=(
+                            'Stable-key map manifest path (JSON or binary). Default: ../map-work/map_tx_manifest.json. '
+                            'Used automatically when downloaded mapjson keys match the stable format.'
+                        ))
+    parser.add_argument('--metadata-cache', metavar='PATH',
+                        help=(
+                            'Optional JSON file that caches Transifex project/resource/language ids '
+                            'between runs. Default: fetch metadata once per run without caching.'
+                        ))
+    parser.add_argument('--metadata-cache-ttl', type=float, default=86400.0, metavar='SECONDS',
+                        help='Maximum age of --metadata-cache before it is refreshed. Default: 86400')
+    parser.add_argument('--fingerprint-file', metavar='PATH',
+                        help=(
+                            'Fingerprint store used to skip unchanged resources. '
+                            'Default: .pull-fingerprints.json in script dir.'
+                        ))
+    parser.add_argument('--force', action='store_true',
+                        help='Ignore stored fingerprints and download/rewrite every selected resource.')
+    parser.add_argument('--verbosity', choices=['quiet', 'normal', 'debug'], default='normal',
+                        help='Logging detail for async download steps. Default: normal')
+    parser.add_argument('--jobs', type=int, default=1, metavar='N',
+                        help=(
+                            'Number of language/resource exports to run concurrently. With N > 1 all '
+                            'async export jobs are created up front and polled/downloaded by N workers. '
+                            'Default: 1 (sequential)'
+                        ))
+    return parser
+
+def parse_args(argv=None):
+    parser = build_parser()
+    parsed_args = parser.parse_args(argv)
+    if parsed_args.raw_map_only and not parsed_args.raw_map_output_dir:
+        parser.error('--raw-map-only requires --raw-map-output-dir')
+    if parsed_args.jobs < 1:
+        parser.error('--jobs must be at least 1')
+    return parsed_args
+
+
+def load_tx_http_module():
+    module_path = os.path.join(script_dir, "tx_http.py")
+    spec = importlib.util.spec_from_file_location("quran_tft_tx_http", module_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
 
-# Read the API token from the file
-api_token_path = args.api_key_file or os.path.join(script_dir, 'transifex-api-key')
-with open(api_token_path, 'r') as token_file:
-    api_token = token_file.read().strip()
-assert api_token, "ERROR: API token is missing or empty. Please check the 'transifex-api-key' file."
 
-# Initialize the Transifex API with the credentials
-transifex_api.setup(auth=api_token)
+def record_import_time(name, started):
+    elapsed = time.perf_counter() - started
+    import_timings[name] = elapsed
+    if args is not None and should_log('debug'):
+        print(f"Imported {name} in {elapsed * 1000:.1f} ms")
+
+
+def load_transifex_api():
+    global transifex_api
+    if transifex_api is None:
+        started = time.perf_counter()
+        from transifex.api import transifex_api as loaded_transifex_api
+        transifex_api = loaded_transifex_api
+        record_import_time('transifex.api', started)
+    return transifex_api
+
+
+def load_http_modules():
+    global requests, tx_http
+    if tx_http is None:
+        started = time.perf_counter()
+        import requests as loaded_requests
+        requests = loaded_requests
+        tx_http = load_tx_http_module()
+        record_import_time('requests', started)
+
+
+def load_icu():
+    global Collator, Locale
+    if Collator is not None:
+        return
+
+    started = time.perf_counter()
+    import ctypes
+
+    # Path to your Homebrew ICU 76 libraries (adjust if using Apple Silicon)
+    icu_lib_path = "/usr/local/opt/icu4c@76/lib"
+
+    # Explicitly load the necessary ICU libraries into the global namespace.
+    # This forces the dynamic linker to use these libraries instead of the system ICU.
+    for lib_name in ["libicuuc.76.dylib", "libicui18n.76.dylib", "libicudata.76.dylib"]:
+        lib_path = os.path.join(icu_lib_path, lib_name)
+        print(f"Loading ICU library: {lib_path}")
+        ctypes.CDLL(lib_path, mode=ctypes.RTLD_GLOBAL)
+
+    from icu import Collator as LoadedCollator, Locale as LoadedLocale
+    Collator, Locale = LoadedCollator, LoadedLocale
+    record_import_time('icu', started)
+
+
+def get_http_session():
+    """Shared keep-alive session for export file downloads, created on first use."""
+    global http_session
+    with http_session_lock:
+        if http_session is None:
+            load_http_modules()
+            http_session = tx_http.build_session(
+                retries=args.download_retries,
+                backoff_factor=args.download_backoff,
+                pool_size=args.http_pool_size or max(args.jobs, tx_http.DEFAULT_POOL_SIZE),
+            )
+    return http_session
 
-# Define the project and resource details
-organization_slug = args.organization
-project_slug = args.project
-resource_slugs = args.resource if args.resource else ALL_RESOURCE_SLUGS
 
 def parse_resource_override_list(raw_list, field_name, language_code):
     if raw_list is None:
@@ -203,63 +321,187 @@ def load_supported_languages(filename=None):
 
     return list(language_names.keys()), language_names, language_settings
 
-language_codes, language_names, language_settings = load_supported_languages(args.languages_file)
-
-# Filter language codes if --lang is specified
-if args.lang:
-    invalid_langs = [l for l in args.lang if l not in language_names]
-    if invalid_langs:
-        print(f"ERROR: Unknown language code(s): {', '.join(invalid_langs)}")
-        print(f"Available: {', '.join(sorted(language_names.keys()))}")
-        sys.exit(1)
-    language_codes = args.lang
-
-# Fetch organization and project
-organization = transifex_api.Organization.get(slug=organization_slug)
-project = organization.fetch('projects').get(slug=project_slug)
-
-# Base path for saving translations
-base_path = args.output_dir or os.path.normpath(os.path.join(script_dir, "../../app/src/assets/translations"))
-
-# Print run configuration
-print(f"\n--- Configuration ---")
-print(f"Languages: {', '.join(language_codes)}")
-print(f"Resources: {', '.join(resource_slugs)}")
-print(f"Output:    {base_path}")
-print(f"Download:  {args.translation_mode}")
-if args.raw_map_output_dir:
-    print(f"Raw maps:  {args.raw_map_output_dir}")
-if args.raw_map_only:
-    print(f"Raw only:  yes")
-if 'mapjson' in resource_slugs:
-    print(f"Map manifest: {map_manifest_path}")
-if args.dry_run:
-    print(f"Mode:      DRY RUN (no files will be written)")
-elif args.no_stage:
-    print(f"Mode:      NO STAGE (files written but not staged/committed)")
-elif args.no_commit:
-    print(f"Mode:      NO COMMIT (files written and staged but not committed)")
-print(f"---------------------\n")
+
+def load_metadata_cache():
+    """Return cached project/resource/language ids, or None when absent, stale, or for another project."""
+    if not args.metadata_cache or not os.path.exists(args.metadata_cache):
+        return None
+    try:
+        with open(args.metadata_cache, 'r', encoding='utf-8') as cache_file:
+            cached = json.load(cache_file)
+    except (OSError, json.JSONDecodeError) as exc:
+        print(f"Ignoring unreadable metadata cache {args.metadata_cache}: {exc}")
+        return None
+    if (
+        cached.get('organization') != organization_slug
+        or cached.get('project') != project_slug
+        or time.time() - cached.get('fetched_at', 0) > args.metadata_cache_ttl
+    ):
+        return None
+    return cached
+
+
+def save_metadata_cache(project, resources_by_slug, languages_by_code):
+    cache_dir = os.path.dirname(os.path.abspath(args.metadata_cache))
+    os.makedirs(cache_dir, exist_ok=True)
+    cached = {
+        'organization': organization_slug,
+        'project': project_slug,
+        'fetched_at': time.time(),
+        'project_id': project.id,
+        'resources': {slug: resource.id for slug, resource in sorted(resources_by_slug.items())},
+        'languages': {code: language.id for code, language in sorted(languages_by_code.items())},
+    }
+    with open(args.metadata_cache, 'w', encoding='utf-8') as cache_file:
+        json.dump(cached, cache_file, ensure_ascii=False, indent=4)
+
+
+def load_project_metadata():
+    """
+    Fetch the project and every resource/language handle once per run.
+
+    The same handles are reused for every language/resource export, so metadata
+    costs one bulk listing per kind instead of a lookup per language x resource.
+    With --metadata-cache the ids are reused across runs until the TTL expires.
+    """
+    cached = load_metadata_cache()
+    if cached is not None:
+        print(f"Using cached Transifex metadata from {args.metadata_cache}")
+        project = transifex_api.Project(id=cached['project_id'])
+        resources_by_slug = {
+            slug: transifex_api.Resource(id=resource_id)
+            for slug, resource_id in cached['resources'].items()
+        }
+        languages_by_code = {
+            code: transifex_api.Language(id=language_id)
+            for code, language_id in cached['languages'].items()
+        }
+        return project, resources_by_slug, languages_by_code
+
+    organization = transifex_api.Organization.get(slug=organization_slug)
+    project = organization.fetch('projects').get(slug=project_slug)
+    resources_by_slug = {resource.slug: resource for resource in project.fetch('resources').all()}
+    languages_by_code = {language.code: language for language in project.fetch('languages').all()}
+    if args.metadata_cache:
+        save_metadata_cache(project, resources_by_slug, languages_by_code)
+    return project, resources_by_slug, languages_by_code
+
+
+def configure(parsed_args):
+    """Set up the per-run module state: credentials, sessions, languages, and project metadata."""
+    global args, map_manifest_path, fingerprint_path, http_session
+    global organization_slug, project_slug, resource_slugs
+    global language_codes, language_names, language_settings
+    global project, project_resources, project_languages, base_path
+    global fingerprints, fingerprints_changed, _project_stats_cache
+    global _map_tx_manifest_cache, _map_tx_manifest_index_cache
+
+    args = parsed_args
+    http_session = None
+    load_transifex_api()
+
+    map_manifest_path = args.map_manifest or default_map_manifest_path
+    fingerprint_path = args.fingerprint_file or os.path.join(script_dir, ".pull-fingerprints.json")
+    _map_tx_manifest_cache = None
+    _map_tx_manifest_index_cache = None
+    _project_stats_cache = None
+    fingerprints = {}
+    fingerprints_changed = False
+
+    # Read the API token from the file
+    api_token_path = args.api_key_file or os.path.join(script_dir, 'transifex-api-key')
+    with open(api_token_path, 'r') as token_file:
+        api_token = token_file.read().strip()
+    assert api_token, "ERROR: API token is missing or empty. Please check the 'transifex-api-key' file."
+
+    # Initialize the Transifex API with the credentials
+    transifex_api.setup(auth=api_token)
+
+    # Define the project and resource details
+    organization_slug = args.organization
+    project_slug = args.project
+    resource_slugs = args.resource if args.resource else ALL_RESOURCE_SLUGS
+
+    language_codes, language_names, language_settings = load_supported_languages(args.languages_file)
+
+    # Filter language codes if --lang is specified
+    if args.lang:
+        invalid_langs = [l for l in args.lang if l not in language_names]
+        if invalid_langs:
+            print(f"ERROR: Unknown language code(s): {', '.join(invalid_langs)}")
+            print(f"Available: {', '.join(sorted(language_names.keys()))}")
+            sys.exit(1)
+        language_codes = args.lang
+
+    # Fetch organization, project, resources and languages
+    project, project_resources, project_languages = load_project_metadata()
+
+    # Base path for saving translations
+    base_path = args.output_dir or os.path.normpath(os.path.join(script_dir, "../../app/src/assets/translations"))
+
+    # Print run configuration
+    print(f"\n--- Configuration ---")
+    print(f"Languages: {', '.join(language_codes)}")
+    print(f"Resources: {', '.join(resource_slugs)}")
+    print(f"Output:    {base_path}")
+    print(f"Download:  {args.translation_mode}")
+    if args.jobs > 1:
+        print(f"Jobs:      {args.jobs}")
+    if args.raw_map_output_dir:
+        print(f"Raw maps:  {args.raw_map_output_dir}")
+    if args.raw_map_only:
+        print(f"Raw only:  yes")
+    if 'mapjson' in resource_slugs:
+        print(f"Map manifest: {map_manifest_path}")
+    if args.dry_run:
+        print(f"Mode:      DRY RUN (no files will be written)")
+    elif args.no_stage:
+        print(f"Mode:      NO STAGE (files written but not staged/committed)")
+    elif args.no_commit:
+        print(f"Mode:      NO COMMIT (files written and staged but not committed)")
+    print(f"---------------------\n")
+
+
+# One collator per locale and a memo of sort keys per locale for this process.
+# The memo is deliberately not persisted: ICU sort keys are only comparable
+# within one ICU version and collation rule set.
+_collators = {}
+_sort_key_memos = {}
+
+
+def get_collator(language_code):
+    collator = _collators.get(language_code)
+    if collator is None:
+        load_icu()
+        collator = _collators[language_code] = Collator.createInstance(Locale(language_code))
+    return collator
 
 
 def get_sort_key_func(language_code):
     """
-    Returns a sort key function using PyICU's Collator for the specified language code.
+    Returns a memoized sort key function using PyICU's Collator for the specified language code.
     """
-    collator = Collator.createInstance(Locale(language_code))
+    collator = get_collator(language_code)
+    memo = _sort_key_memos.setdefault(language_code, {})
     def icu_sort_key(s):
         # Get the sort key for the given string
-        return collator.getSortKey(str(s))
+        s = str(s)
+        sort_key = memo.get(s)
+        if sort_key is None:
+            sort_key = memo[s] = collator.getSortKey(s)
+        return sort_key
     return icu_sort_key
 
 def sort_dictionary(data, language_code):
     """
     Recursively sort a dictionary by keys using the ICU-based sort key function for the specified language.
     """
+    return sort_dictionary_with(data, get_sort_key_func(language_code))
+
+def sort_dictionary_with(data, sort_key_func):
     if isinstance(data, dict):
-        sort_key_func = get_sort_key_func(language_code)
         sorted_items = sorted(data.items(), key=lambda item: sort_key_func(item[0]))
-        return {k: sort_dictionary(v, language_code) for k, v in sorted_items}
+        return {k: sort_dictionary_with(v, sort_key_func) for k, v in sorted_items}
     return data
 
 def extract_chapter_verse_pairs(s):
@@ -376,6 +618,7 @@ def reconstruct_dictionary(transformed_data, language_code):
 
 _map_tx_module = None
 _map_tx_manifest_cache = None
+_map_tx_manifest_index_cache = None
 
 
 def load_map_tx_module():
@@ -408,33 +651,33 @@ def load_map_tx_manifest():
             "Regenerate it with scrapper/map-work/map_tx.py export."
         )
 
-    with open(map_manifest_path, "r", encoding="utf-8") as manifest_file:
-        manifest = json.load(manifest_file)
-    if manifest.get("kind") != "quran-tft-map-tx-manifest":
+    map_tx = load_map_tx_module()
+    manifest = map_tx.load_manifest(map_manifest_path)
+    if manifest.get("kind") != map_tx.MANIFEST_KIND:
         raise ValueError(f"Unexpected stable map manifest kind in {map_manifest_path}")
 
     _map_tx_manifest_cache = manifest
     return manifest
 
 
-def get_manifest_key_set(manifest):
-    return {item["key"] for item in manifest.get("items", [])}
+def load_map_tx_manifest_index():
+    global _map_tx_manifest_index_cache
+    if _map_tx_manifest_index_cache is None:
+        _map_tx_manifest_index_cache = load_map_tx_module().ManifestIndex(load_map_tx_manifest())
+    return _map_tx_manifest_index_cache
 
 
-def is_stable_map_payload(transformed_data, manifest):
+def is_stable_map_payload(transformed_data, manifest_index):
     if not isinstance(transformed_data, dict) or not transformed_data:
         return False
-    keys = set(transformed_data.keys())
-    manifest_keys = get_manifest_key_set(manifest)
-    return bool(keys) and keys.issubset(manifest_keys)
+    return transformed_data.keys() <= manifest_index.keys
 
 
 def reconstruct_stable_map(transformed_data, language_code, language_label):
     map_tx = load_map_tx_module()
-    manifest = load_map_tx_manifest()
-    manifest_keys = get_manifest_key_set(manifest)
+    manifest_index = load_map_tx_manifest_index()
 
-    extra_keys = set(transformed_data.keys()) - manifest_keys
+    extra_keys = [key for key in transformed_data if key not in manifest_index.keys]
     if extra_keys:
         sample = ", ".join(sorted(extra_keys)[:5])
         raise ValueError(
@@ -443,15 +686,21 @@ def reconstruct_stable_map(transformed_data, language_code, language_label):
 
     # Transifex can return blank strings for untranslated stable keys. Treat those
     # as absent so the client map falls back to the English source path.
+    normalized_values = map_tx.normalize_payload(transformed_data)
     cleaned_flat = {
-        key: value
-        for key, value in transformed_data.items()
-        if isinstance(value, str) and not map_tx.is_blank_translation_value(value)
+        key: transformed_data[key]
+        for key, normalized in normalized_values.items()
+        if not normalized.blank
     }
-    reconstructed = map_tx.reconstruct_map(cleaned_flat, manifest, fallback_to_source=True)
+    reconstructed = map_tx.reconstruct_map(
+        cleaned_flat,
+        manifest_index.manifest,
+        fallback_to_source=True,
+        index=manifest_index,
+    )
     print(
         f"[{language_label}/mapjson] Detected stable-key map payload "
-        f"({len(cleaned_flat)} translated values, {len(manifest.get('items', [])) - len(cleaned_flat)} source fallbacks)"
+        f"({len(cleaned_flat)} translated values, {len(manifest_index) - len(cleaned_flat)} source fallbacks)"
     )
     return sort_dictionary(reconstructed, language_code)
 
@@ -480,8 +729,7 @@ def extract_async_errors(download_job):
     return []
 
 
-def wait_for_translation_download_url(resource, language, language_code, resource_slug):
-    started_at = time.monotonic()
+def create_translation_download_job(resource, language, language_code, resource_slug):
     download_kwargs = {
         'resource': resource,
         'language': language,
@@ -499,91 +747,298 @@ def wait_for_translation_download_url(resource, language, language_code, resourc
         f"Async download job created (job={job_label}, status={last_status or 'unknown'})",
         level='debug'
     )
+    return download_job
 
-    while True:
-        errors = extract_async_errors(download_job)
-        if errors:
-            detail = errors[0].get('detail', 'Unknown async download error')
-            raise RuntimeError(
-                f"Transifex async download failed for '{language_code}/{resource_slug}': {detail}"
-            )
 
-        if download_job.redirect:
-            elapsed = time.monotonic() - started_at
-            log_download_event(
-                language_code,
-                resource_slug,
-                f"Export ready after {elapsed:.1f}s"
-            )
-            return download_job.redirect
+POLL_HISTOGRAM_BUCKETS = [1, 2, 5, 10, 30, 60, 120, 300]
 
-        current_status = (getattr(download_job, 'attributes', {}) or {}).get('status')
-        if current_status == 'failed':
-            raise RuntimeError(
-                f"Transifex async download failed for '{language_code}/{resource_slug}' "
-                f"without error details."
-            )
 
-        elapsed = time.monotonic() - started_at
-        if elapsed > args.poll_timeout:
-            raise TimeoutError(
-                f"Timed out after {elapsed:.1f}s waiting for '{language_code}/{resource_slug}' "
-                f"(job={job_label}, status={current_status or 'unknown'})."
-            )
+def retry_after_seconds(exc):
+    """Return the Retry-After hint (in seconds) carried by a throttled API error, if any."""
+    response = getattr(exc, 'response', None)
+    status_code = getattr(exc, 'status_code', None) or getattr(response, 'status_code', None)
+    headers = getattr(response, 'headers', None) or {}
+    retry_after = headers.get('Retry-After')
+    if retry_after is not None:
+        try:
+            return max(float(retry_after), 0.0)
+        except ValueError:
+            # HTTP-date hints are rare here; fall back to the regular backoff.
+            return 0.0
+    if status_code in (429, 503):
+        return 0.0
+    return None
 
-        if current_status != last_status and current_status:
-            log_download_event(
-                language_code,
-                resource_slug,
-                f"Async status changed to '{current_status}' after {elapsed:.1f}s",
-                level='debug'
+
+def inspect_download_job(task):
+    """
+    Check the last known state of a task's async export job.
+
+    Returns the download URL once the export is ready, None while it is still being
+    built, and raises when Transifex reports a failure or the job exceeds --poll-timeout.
+    """
+    download_job = task['download_job']
+    language_code = task['language_code']
+    resource_slug = task['resource_slug']
+
+    errors = extract_async_errors(download_job)
+    if errors:
+        detail = errors[0].get('detail', 'Unknown async download error')
+        raise RuntimeError(
+            f"Transifex async download failed for '{language_code}/{resource_slug}': {detail}"
+        )
+
+    elapsed = time.monotonic() - task['started_at']
+    if download_job.redirect:
+        log_download_event(
+            language_code,
+            resource_slug,
+            f"Export ready after {elapsed:.1f}s"
+        )
+        return download_job.redirect
+
+    current_status = (getattr(download_job, 'attributes', {}) or {}).get('status')
+    if current_status == 'failed':
+        raise RuntimeError(
+            f"Transifex async download failed for '{language_code}/{resource_slug}' "
+            f"without error details."
+        )
+
+    if elapsed > args.poll_timeout:
+        raise TimeoutError(
+            f"Timed out after {elapsed:.1f}s waiting for '{language_code}/{resource_slug}' "
+            f"(job={download_job.id or 'unknown'}, status={current_status or 'unknown'})."
+        )
+
+    if current_status != task.get('last_status') and current_status:
+        log_download_event(
+            language_code,
+            resource_slug,
+            f"Async status changed to '{current_status}' after {elapsed:.1f}s",
+            level='debug'
+        )
+        task['last_status'] = current_status
+    return None
+
+
+class DownloadJobPoller:
+    """
+    Single scheduler for every outstanding async export job.
+
+    Each job is reloaded on its own exponential backoff schedule (starting at
+    --poll-interval, capped at --poll-max-interval, with jitter so jobs created
+    together do not poll in lockstep). Throttled reloads wait for the server's
+    Retry-After hint instead. Poll counts and time-to-ready are recorded so the
+    number of API calls per pull can be reported.
+    """
+
+    def __init__(self, base_interval, max_interval):
+        self.base_interval = base_interval
+        self.max_interval = max(max_interval, base_interval)
+        self.schedule = []
+        self.sequence = 0
+        self.polls_issued = 0
+        self.polls_by_job = {}
+        self.ready_seconds = []
+
+    def next_interval(self, task):
+        interval = min(self.base_interval * (2 ** task['poll_attempt']), self.max_interval)
+        task['poll_attempt'] += 1
+        return random.uniform(interval / 2, interval)
+
+    def push(self, task, delay):
+        self.sequence += 1
+        heapq.heappush(self.schedule, (time.monotonic() + delay, self.sequence, task))
+
+    def add(self, task):
+        """Start tracking a freshly created job. Returns the URL if it is already ready."""
+        task['poll_attempt'] = 0
+        task['last_status'] = (getattr(task['download_job'], 'attributes', {}) or {}).get('status')
+        self.polls_by_job[task_label(task)] = 0
+        download_url = inspect_download_job(task)
+        if download_url:
+            self.record_ready(task)
+            return download_url
+        self.push(task, self.next_interval(task))
+        return None
+
+    def record_ready(self, task):
+        self.ready_seconds.append(time.monotonic() - task['started_at'])
+
+    @property
+    def pending(self):
+        return len(self.schedule)
+
+    def seconds_until_next_poll(self):
+        if not self.schedule:
+            return None
+        return max(self.schedule[0][0] - time.monotonic(), 0.0)
+
+    def poll_due(self):
+        """Reload every job whose poll time has come. Returns the (task, url) pairs that became ready."""
+        ready = []
+        now = time.monotonic()
+        while self.schedule and self.schedule[0][0] <= now:
+            _, _, task = heapq.heappop(self.schedule)
+            self.polls_issued += 1
+            self.polls_by_job[task_label(task)] += 1
+            try:
+                task['download_job'].reload()
+            except Exception as exc:
+                retry_after = retry_after_seconds(exc)
+                if retry_after is None:
+                    raise
+                delay = retry_after or self.next_interval(task)
+                log_download_event(
+                    task['language_code'],
+                    task['resource_slug'],
+                    f"Status check throttled; retrying in {delay:.1f}s",
+                    level='debug'
+                )
+                self.push(task, delay)
+                continue
+
+            download_url = inspect_download_job(task)
+            if download_url:
+                self.record_ready(task)
+                ready.append((task, download_url))
+            else:
+                self.push(task, self.next_interval(task))
+        return ready
+
+    def wait(self, task):
+        """Block until one specific job is ready (sequential mode) and return its URL."""
+        while True:
+            delay = self.seconds_until_next_poll()
+            if delay:
+                time.sleep(delay)
+            for ready_task, download_url in self.poll_due():
+                if ready_task is task:
+                    return download_url
+
+    def stats(self):
+        histogram = {}
+        for seconds in self.ready_seconds:
+            bucket = next(
+                (f"<={limit}s" for limit in POLL_HISTOGRAM_BUCKETS if seconds <= limit),
+                f">{POLL_HISTOGRAM_BUCKETS[-1]}s"
             )
-            last_status = current_status
+            histogram[bucket] = histogram.get(bucket, 0) + 1
+        return {
+            'jobs': len(self.polls_by_job),
+            'polls_issued': self.polls_issued,
+            'polls_by_job': dict(self.polls_by_job),
+            'time_to_ready_histogram': histogram,
+        }
 
-        time.sleep(args.poll_interval)
-        download_job.reload()
 
+def task_label(task):
+    return f"{task['language_code']}/{task['resource_slug']}"
 
-def download_translation_payload(resource, language, language_code, resource_slug):
-    overall_started_at = time.monotonic()
-    log_download_event(language_code, resource_slug, "Requesting translation export")
-    download_url = wait_for_translation_download_url(
-        resource=resource,
-        language=language,
-        language_code=language_code,
-        resource_slug=resource_slug
-    )
 
+def print_poll_stats(poller):
+    if not should_log('normal') or not poller.polls_by_job:
+        return
+    stats = poller.stats()
+    print(f"\nAsync export polling: {stats['polls_issued']} status checks for {stats['jobs']} jobs")
+    if should_log('debug'):
+        for label, polls in sorted(stats['polls_by_job'].items()):
+            print(f"  {label}: {polls} polls")
+        buckets = [f"<={limit}s" for limit in POLL_HISTOGRAM_BUCKETS] + [f">{POLL_HISTOGRAM_BUCKETS[-1]}s"]
+        print("  Time to ready: " + ", ".join(
+            f"{bucket}: {stats['time_to_ready_histogram'][bucket]}"
+            for bucket in buckets
+            if bucket in stats['time_to_ready_histogram']
+        ))
+
+
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
+
+
+def download_exported_file(task, download_url):
+    """
+    Stream the exported file to a temporary file in fixed-size chunks.
+
+    Returns (payload_path, payload_sha256). The caller owns payload_path and removes it
+    once the payload has been written out.
+    """
+    language_code = task['language_code']
+    resource_slug = task['resource_slug']
     log_download_event(language_code, resource_slug, "Downloading exported file", level='debug')
+    session = get_http_session()
+    fd, payload_path = tempfile.mkstemp(prefix=f"pull-{language_code}-{resource_slug}-", suffix='.json')
     try:
-        response = requests.get(download_url, timeout=(10, args.download_timeout))
-        response.raise_for_status()
+        with os.fdopen(fd, 'wb') as payload_file:
+            attempt = 0
+            while True:
+                body_started = False
+                digest = hashlib.sha256()
+                downloaded_bytes = 0
+                payload_file.seek(0)
+                payload_file.truncate()
+                try:
+                    # The session already retries connection failures and retryable
+                    # statuses; a reset in the middle of the body restarts the file here.
+                    with session.get(download_url, timeout=(10, args.download_timeout), stream=True) as response:
+                        response.raise_for_status()
+                        body_started = True
+                        for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                            payload_file.write(chunk)
+                            digest.update(chunk)
+                            downloaded_bytes += len(chunk)
+                        status_code = response.status_code
+                    break
+                except requests.RequestException as exc:
+                    if not (body_started and tx_http.is_transient_error(exc) and attempt < args.download_retries):
+                        raise
+                    delay = args.download_backoff * (2 ** attempt)
+                    attempt += 1
+                    log_download_event(
+                        language_code,
+                        resource_slug,
+                        f"Download interrupted ({exc}); retrying in {delay:.1f}s",
+                    )
+                    time.sleep(delay)
     except requests.RequestException as exc:
+        os.remove(payload_path)
         raise RuntimeError(
             f"Failed to download exported file for '{language_code}/{resource_slug}': {exc}"
         ) from exc
+    except BaseException:
+        os.remove(payload_path)
+        raise
 
-    response.encoding = 'utf-8'
-    content_length = response.headers.get('Content-Length', 'unknown')
     log_download_event(
         language_code,
         resource_slug,
         (
             f"File downloaded successfully "
-            f"(HTTP {response.status_code}, elapsed={time.monotonic() - overall_started_at:.1f}s)"
+            f"(HTTP {status_code}, elapsed={time.monotonic() - task['started_at']:.1f}s)"
         )
     )
     log_download_event(
         language_code,
         resource_slug,
-        f"Downloaded bytes={content_length}",
+        f"Downloaded bytes={downloaded_bytes}",
         level='debug'
     )
-    return response.text
+    return payload_path, digest.hexdigest()
+
+
+def submit_download_job(task, poller):
+    """Create the async export job for a task and register it with the poller."""
+    task['started_at'] = time.monotonic()
+    log_download_event(task['language_code'], task['resource_slug'], "Requesting translation export")
+    task['download_job'] = create_translation_download_job(
+        resource=task['resource'],
+        language=task['language'],
+        language_code=task['language_code'],
+        resource_slug=task['resource_slug']
+    )
+    return poller.add(task)
 
-updated_languages = set()  # Keep track of languages with changes
 
-for language_code in language_codes:
+def select_language_resources(language_code):
     setting = language_settings.get(language_code, {})
     include_resources = setting.get("include_resources") or []
     exclude_resources = setting.get("exclude_resources") or []
@@ -595,101 +1050,365 @@ for language_code in language_codes:
     if exclude_resources:
         exclude_set = set(exclude_resources)
         selected_resources = [slug for slug in selected_resources if slug not in exclude_set]
+    return selected_resources
 
-    if not selected_resources:
-        print(
-            f"Skipping language '{language_code}': no resources left after "
-            f"supported-languages.json filters."
-        )
-        continue
 
-    # Fetch the language object
-    language = transifex_api.Language.get(code=language_code)
+def build_download_tasks():
+    tasks = []
+    for language_code in language_codes:
+        selected_resources = select_language_resources(language_code)
+        if not selected_resources:
+            print(
+                f"Skipping language '{language_code}': no resources left after "
+                f"supported-languages.json filters."
+            )
+            continue
 
-    # Initialize a flag to check if any files were saved for this language
-    files_saved = False
+        language = project_languages.get(language_code)
+        if language is None:
+            # Not a project target language (yet); look it up directly.
+            language = transifex_api.Language.get(code=language_code)
+            project_languages[language_code] = language
+
+        for resource_slug in selected_resources:
+            resource = project_resources.get(resource_slug)
+            if resource is None:
+                raise ValueError(
+                    f"ERROR: Resource '{resource_slug}' not found in Transifex project '{project_slug}'."
+                )
+            tasks.append({
+                'language_code': language_code,
+                'resource_slug': resource_slug,
+                'language': language,
+                'resource': resource,
+                'download_job': None,
+                'started_at': None,
+            })
+    return tasks
+
+
+REMOTE_STATS_FIELDS = [
+    'last_update',
+    'last_translation_update',
+    'last_review_update',
+    'last_proofread_update',
+    'translated_strings',
+    'reviewed_strings',
+    'proofread_strings',
+    'total_strings',
+]
 
-    for resource_slug in selected_resources:
-        # Fetch the resource
-        resource = project.fetch('resources').get(slug=resource_slug)
+_project_stats_cache = None
 
-        # Start the async export, poll until it is ready, and then download the file.
-        response_text = download_translation_payload(
-            resource=resource,
-            language=language,
-            language_code=language_code,
-            resource_slug=resource_slug
-        )
 
-        # Define the output file path (relative to script_dir)
-        lang_dir = os.path.join(base_path, language_code)
-        resource_name = resource_slug.replace('json', '')
-        output_filename = f"{resource_name}_{language_code}.json"
-        output_path = os.path.join(lang_dir, output_filename)
+def fetch_project_stats():
+    """Fetch ResourceLanguageStats for the whole project once; shared by fingerprints and completeness."""
+    global _project_stats_cache
+    if _project_stats_cache is None:
+        _project_stats_cache = list(transifex_api.ResourceLanguageStats.filter(project=project))
+    return _project_stats_cache
 
-        try:
-            translated_content = json.loads(response_text)
-        except json.JSONDecodeError as e:
-            print(f"ERROR: while parsing JSON for language '{language_code}' and resource '{resource_slug}': {e}")
-
-            # Check if this is the known issue with Russian 'appendicesjson'
-            if language_code == 'ru' and resource_slug == 'appendicesjson':
-                print("Attempting to fix known control character issue in Russian 'appendicesjson'...")
-                # Replace the specific control character (\x02) with a hyphen or appropriate character
-                cleaned_text = response_text.replace('\x02', '-')
-                try:
-                    translated_content = json.loads(cleaned_text)
-                    print("Successfully parsed JSON after cleaning.")
-                except json.JSONDecodeError as e_inner:
-                    print(f"Failed to parse cleaned JSON for '{language_code}' and '{resource_slug}': {e_inner}")
-                    continue
-            else:
-                raise
-
-        # Only proceed if there is content to save
-        if translated_content:
-            if resource_slug == 'mapjson' and args.raw_map_output_dir and not args.dry_run:
-                os.makedirs(args.raw_map_output_dir, exist_ok=True)
-                raw_output_path = os.path.join(args.raw_map_output_dir, f"map_{language_code}.json")
-                with open(raw_output_path, 'w', encoding='utf-8') as raw_file:
-                    json.dump(translated_content, raw_file, ensure_ascii=False, indent=4)
-                print(f"Saved raw map payload {raw_output_path}")
-
-            if resource_slug == 'mapjson' and args.raw_map_only:
-                files_saved = True
-                continue
 
-            if args.dry_run:
-                print(f"[DRY RUN] Would save {output_path}")
-                files_saved = True
-            else:
-                # Ensure the language directory exists
-                os.makedirs(lang_dir, exist_ok=True)
-                files_saved = True
-
-                if resource_slug == 'mapjson':
-                    transformed_data = translated_content
-                    manifest = load_map_tx_manifest()
-                    if is_stable_map_payload(transformed_data, manifest):
-                        reconstructed_dict = reconstruct_stable_map(
-                            transformed_data,
-                            language_code,
-                            language_code,
-                        )
-                    else:
-                        reconstructed_dict = reconstruct_dictionary(transformed_data, language_code)
-                    with open(output_path, 'w', encoding='utf-8') as new_file:
-                        json.dump(reconstructed_dict, new_file, ensure_ascii=False, indent=4)
-                else:
-                    with open(output_path, 'w', encoding='utf-8') as new_file:
-                        json.dump(translated_content, new_file, ensure_ascii=False, indent=4)
-                print(f"Saved {output_path}")
+def remote_stats_by_task():
+    """Map (language_code, resource_slug) to the Transifex stats that change when a translation changes."""
+    remote_stats = {}
+    for stat in fetch_project_stats():
+        # Stats ids look like o:<org>:p:<project>:r:<resource>:l:<language>
+        resource_id, separator, language_code = (stat.id or '').rpartition(':l:')
+        if not separator or ':r:' not in resource_id:
+            continue
+        resource_slug = resource_id.rsplit(':r:', 1)[1]
+        attributes = getattr(stat, 'attributes', {}) or {}
+        remote_stats[(language_code, resource_slug)] = {
+            field: attributes.get(field)
+            for field in REMOTE_STATS_FIELDS
+        }
+    return remote_stats
+
+
+def sha256_file(path):
+    if not os.path.exists(path):
+        return None
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def translation_output_path(language_code, resource_slug):
+    resource_name = resource_slug.replace('json', '')
+    return os.path.join(base_path, language_code, f"{resource_name}_{language_code}.json")
+
+
+def payload_variant(resource_slug):
+    """Everything besides the payload itself that shapes the written file."""
+    variant = {'translation_mode': args.translation_mode}
+    if resource_slug == 'mapjson':
+        variant['raw_map_only'] = args.raw_map_only
+        variant['map_manifest_sha256'] = sha256_file(map_manifest_path)
+    return variant
+
+
+def raw_map_payload_requested():
+    """True when the raw mapjson payload itself is an output of this run."""
+    return bool(args.raw_map_output_dir) or collected_raw_maps is not None
+
+
+def load_fingerprints():
+    if args.force or not os.path.exists(fingerprint_path):
+        return {}
+    try:
+        with open(fingerprint_path, 'r', encoding='utf-8') as fingerprint_file:
+            stored = json.load(fingerprint_file)
+    except (OSError, json.JSONDecodeError) as exc:
+        print(f"Ignoring unreadable fingerprint store {fingerprint_path}: {exc}")
+        return {}
+    return stored.get('entries', {}) if stored.get('version') == 1 else {}
+
+
+def save_fingerprints():
+    if args.dry_run or not fingerprints_changed:
+        return
+    os.makedirs(os.path.dirname(os.path.abspath(fingerprint_path)), exist_ok=True)
+    with open(fingerprint_path, 'w', encoding='utf-8') as fingerprint_file:
+        json.dump({'version': 1, 'entries': fingerprints}, fingerprint_file, ensure_ascii=False, indent=4, sort_keys=True)
+        fingerprint_file.write('\n')
+
+
+def fingerprint_key(language_code, resource_slug):
+    return f"{language_code}/{resource_slug}"
+
+
+def fingerprint_matches_output(entry, language_code, resource_slug):
+    output_path = translation_output_path(language_code, resource_slug)
+    return (
+        entry.get('output_path') == os.path.abspath(output_path)
+        and entry.get('variant') == payload_variant(resource_slug)
+        and entry.get('output_sha256') == sha256_file(output_path)
+    )
+
+
+def is_task_unchanged(task, remote_stats):
+    """True when Transifex reports no change since the last pull and the local file is untouched."""
+    language_code = task['language_code']
+    resource_slug = task['resource_slug']
+    if resource_slug == 'mapjson' and raw_map_payload_requested():
+        # The raw payload itself is a requested output, so it always has to be downloaded.
+        return False
+    entry = fingerprints.get(fingerprint_key(language_code, resource_slug))
+    current_stats = remote_stats.get((language_code, resource_slug))
+    if not entry or not current_stats or entry.get('remote_stats') != current_stats:
+        return False
+    return fingerprint_matches_output(entry, language_code, resource_slug)
+
+
+def skip_unchanged_tasks(tasks):
+    remote_stats = remote_stats_by_task()
+    pending_tasks = []
+    for task in tasks:
+        if not args.force and is_task_unchanged(task, remote_stats):
+            log_download_event(task['language_code'], task['resource_slug'], "Unchanged since last pull; skipping download")
+        else:
+            task['remote_stats'] = remote_stats.get((task['language_code'], task['resource_slug']))
+            pending_tasks.append(task)
+    return pending_tasks
+
+
+def record_fingerprint(task, payload_sha256, output_sha256):
+    global fingerprints_changed
+    language_code = task['language_code']
+    resource_slug = task['resource_slug']
+    fingerprints[fingerprint_key(language_code, resource_slug)] = {
+        'remote_stats': task.get('remote_stats'),
+        'payload_sha256': payload_sha256,
+        'output_sha256': output_sha256,
+        'output_path': os.path.abspath(translation_output_path(language_code, resource_slug)),
+        'variant': payload_variant(resource_slug),
+    }
+    fingerprints_changed = True
+
+
+def write_json_atomically(output_path, data):
+    """
+    Serialize data to a sibling temporary file and swap it in with os.replace.
+
+    The existing file is left untouched when the new bytes are identical.
+    Returns (changed, output_sha256).
+    """
+    temp_path = f"{output_path}.part"
+    try:
+        with open(temp_path, 'w', encoding='utf-8') as temp_file:
+            json.dump(data, temp_file, ensure_ascii=False, indent=4)
+        output_sha256 = sha256_file(temp_path)
+        if output_sha256 == sha256_file(output_path):
+            os.remove(temp_path)
+            return False, output_sha256
+        os.replace(temp_path, output_path)
+        return True, output_sha256
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def load_payload_file(payload_path, language_code, resource_slug):
+    """Parse a downloaded payload from disk. Returns None when it cannot be repaired."""
+    try:
+        with open(payload_path, 'r', encoding='utf-8') as payload_file:
+            return json.load(payload_file)
+    except json.JSONDecodeError as e:
+        print(f"ERROR: while parsing JSON for language '{language_code}' and resource '{resource_slug}': {e}")
+
+        # Check if this is the known issue with Russian 'appendicesjson'
+        if language_code == 'ru' and resource_slug == 'appendicesjson':
+            print("Attempting to fix known control character issue in Russian 'appendicesjson'...")
+            # Replace the specific control character (\x02) with a hyphen or appropriate character
+            with open(payload_path, 'r', encoding='utf-8') as payload_file:
+                cleaned_text = payload_file.read().replace('\x02', '-')
+            try:
+                translated_content = json.loads(cleaned_text)
+                print("Successfully parsed JSON after cleaning.")
+                return translated_content
+            except json.JSONDecodeError as e_inner:
+                print(f"Failed to parse cleaned JSON for '{language_code}' and '{resource_slug}': {e_inner}")
+                return None
+        raise
+
+
+def save_translation_payload(task, payload_path, payload_sha256):
+    """
+    Parse a downloaded export and write it to the output tree.
+
+    Returns True when a file in the language directory changed (or would, in dry-run
+    mode). Payloads identical to the last pull are neither re-parsed nor re-serialized.
+    """
+    language_code = task['language_code']
+    resource_slug = task['resource_slug']
+    output_path = translation_output_path(language_code, resource_slug)
+    lang_dir = os.path.dirname(output_path)
+
+    entry = fingerprints.get(fingerprint_key(language_code, resource_slug))
+    if (
+        entry
+        and entry.get('payload_sha256') == payload_sha256
+        and not (resource_slug == 'mapjson' and raw_map_payload_requested())
+        and fingerprint_matches_output(entry, language_code, resource_slug)
+    ):
+        log_download_event(language_code, resource_slug, "Payload unchanged since last pull; not rewriting")
+        if entry.get('remote_stats') != task.get('remote_stats'):
+            record_fingerprint(task, payload_sha256, entry['output_sha256'])
+        return False
+
+    translated_content = load_payload_file(payload_path, language_code, resource_slug)
+    if translated_content is None:
+        return False
 
-    if files_saved:
+    # Only proceed if there is content to save
+    if not translated_content:
+        # Remember empty exports too, so they are skipped while nothing is written for them.
+        record_fingerprint(task, payload_sha256, sha256_file(output_path))
+        return False
+
+    if resource_slug == 'mapjson' and args.raw_map_output_dir and not args.dry_run:
+        os.makedirs(args.raw_map_output_dir, exist_ok=True)
+        raw_output_path = os.path.join(args.raw_map_output_dir, f"map_{language_code}.json")
+        write_json_atomically(raw_output_path, translated_content)
+        print(f"Saved raw map payload {raw_output_path}")
+
+    if resource_slug == 'mapjson' and collected_raw_maps is not None:
+        collected_raw_maps[language_code] = translated_content
+
+    if resource_slug == 'mapjson' and args.raw_map_only:
+        return True
+
+    if args.dry_run:
+        print(f"[DRY RUN] Would save {output_path}")
+        return True
+
+    # Ensure the language directory exists
+    os.makedirs(lang_dir, exist_ok=True)
+
+    if resource_slug == 'mapjson':
+        # Rebinding drops the raw payload, so only one copy of the map is alive while writing.
+        if is_stable_map_payload(translated_content, load_map_tx_manifest_index()):
+            translated_content = reconstruct_stable_map(
+                translated_content,
+                language_code,
+                language_code,
+            )
+        else:
+            translated_content = reconstruct_dictionary(translated_content, language_code)
+
+    changed, output_sha256 = write_json_atomically(output_path, translated_content)
+    record_fingerprint(task, payload_sha256, output_sha256)
+    if changed:
+        print(f"Saved {output_path}")
+    else:
+        log_download_event(language_code, resource_slug, "Output unchanged; not rewriting")
+    return changed
+
+
+def run_download_tasks(tasks, poller):
+    """
+    Download every task and hand each payload to the writer as soon as it is ready.
+
+    Returns the set of language codes that had at least one file changed.
+    """
+    saved_languages = set()
+
+    def save(task, downloaded):
+        payload_path, payload_sha256 = downloaded
+        try:
+            if save_translation_payload(task, payload_path, payload_sha256):
+                saved_languages.add(task['language_code'])
+        finally:
+            os.remove(payload_path)
+
+    if args.jobs == 1:
+        for task in tasks:
+            download_url = submit_download_job(task, poller) or poller.wait(task)
+            save(task, download_exported_file(task, download_url))
+        return saved_languages
+
+    # Submit every async export before waiting on any of them, so Transifex builds
+    # the files in parallel and total wall time tracks the slowest single export.
+    executor = ThreadPoolExecutor(max_workers=args.jobs)
+    futures = {}
+    try:
+        for task in tasks:
+            download_url = submit_download_job(task, poller)
+            if download_url:
+                futures[executor.submit(download_exported_file, task, download_url)] = task
+
+        # The poller runs on the main thread; ready exports are downloaded by the worker
+        # pool, and payloads are parsed and written here one at a time as they arrive.
+        while poller.pending or futures:
+            delay = poller.seconds_until_next_poll()
+            if futures:
+                done, _ = wait(futures, timeout=delay, return_when=FIRST_COMPLETED)
+                for future in done:
+                    save(futures.pop(future), future.result())
+            elif delay:
+                time.sleep(delay)
+            for task, download_url in poller.poll_due():
+                futures[executor.submit(download_exported_file, task, download_url)] = task
+    except BaseException:
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise
+    executor.shutdown()
+    return saved_languages
+
+
+def stage_updated_languages(saved_languages):
+    updated_languages = set()  # Keep track of languages with changes
+    for language_code in language_codes:
         if args.dry_run:
-            updated_languages.add(language_code)
+            if language_code in saved_languages:
+                updated_languages.add(language_code)
         else:
-            # After saving files for a language, check if there are changes
+            # Check every language, not only the ones saved in this run: edits left
+            # unstaged by --no-stage or a declined commit must still be picked up.
             lang_dir = os.path.join(base_path, language_code)
             lang_status = subprocess.run(
                 ['git', 'status', '--porcelain', lang_dir], capture_output=True, text=True)
@@ -699,122 +1418,176 @@ for language_code in language_codes:
                 if not args.no_stage:
                     # Stage the changed files
                     subprocess.run(['git', 'add', lang_dir])
+    return updated_languages
 
-# --- Update languages.json with completeness percentages ---
-languages_json_changed = False
 
-if not args.skip_completeness and not args.dry_run:
-    # Path to the languages.json file (relative to script_dir)
-    languages_json_path = os.path.normpath(os.path.join(script_dir, "../../app/src/assets/languages.json"))
+def update_completeness():
+    """Update completeness percentages in languages.json. Returns True when the file changed."""
+    languages_json_changed = False
 
-    # Load the existing languages.json file
-    with open(languages_json_path, 'r', encoding='utf-8') as f:
-        languages_data = json.load(f)
+    if not args.skip_completeness and not args.dry_run:
+        # Path to the languages.json file (relative to script_dir)
+        languages_json_path = os.path.normpath(os.path.join(script_dir, "../../app/src/assets/languages.json"))
 
-    # Fetch project language stats
-    project_stats = transifex_api.ResourceLanguageStats.filter(project=project)
+        # Load the existing languages.json file
+        with open(languages_json_path, 'r', encoding='utf-8') as f:
+            languages_data = json.load(f)
 
-    # Calculate completeness percentage per language
-    completeness_percentages = {}
+        # Fetch project language stats
+        project_stats = fetch_project_stats()
 
-    for stat in project_stats:
-        # Parse language and resource details from the string output
-        language_str = str(stat.language)
+        # Calculate completeness percentage per language
+        completeness_percentages = {}
 
-        # Extract language code from the unfetched string representation
-        language_code = language_str.split(': ')[1].split(' ')[0].replace('l:', '')
+        for stat in project_stats:
+            # Parse language and resource details from the string output
+            language_str = str(stat.language)
 
-        # Skip the source language (en)
-        if language_code == 'en':
-            continue
+            # Extract language code from the unfetched string representation
+            language_code = language_str.split(': ')[1].split(' ')[0].replace('l:', '')
 
-        translated_strings = stat.attributes['translated_strings']
-        total_strings = stat.attributes['total_strings']
-
-        # Calculate completeness percentage
-        if language_code not in completeness_percentages:
-            completeness_percentages[language_code] = {'translated_strings': 0, 'total_strings': 0}
-
-        completeness_percentages[language_code]['translated_strings'] += translated_strings
-        completeness_percentages[language_code]['total_strings'] += total_strings
-
-    # Update the 'comp' values in languages_data
-    for language_code, stats in completeness_percentages.items():
-        total_strings = stats['total_strings']
-        translated_strings = stats['translated_strings']
-        completeness_percentage = (translated_strings / total_strings) * 100 if total_strings else 0
-
-        # Round the completeness percentage to two decimal places
-        completeness_percentage = round(completeness_percentage, 2)
-
-        # If the percentage is a whole number, convert it to int
-        if completeness_percentage.is_integer():
-            completeness_percentage = int(completeness_percentage)
-        if language_code in languages_data:
-            old_comp = languages_data[language_code].get('comp', None)
-            languages_data[language_code]['comp'] = completeness_percentage
-            if old_comp != completeness_percentage:
-                languages_json_changed = True
-                print(f"Updated {language_code} completeness to {completeness_percentage}%")
+            # Skip the source language (en)
+            if language_code == 'en':
+                continue
+
+            translated_strings = stat.attributes['translated_strings']
+            total_strings = stat.attributes['total_strings']
+
+            # Calculate completeness percentage
+            if language_code not in completeness_percentages:
+                completeness_percentages[language_code] = {'translated_strings': 0, 'total_strings': 0}
+
+            completeness_percentages[language_code]['translated_strings'] += translated_strings
+            completeness_percentages[language_code]['total_strings'] += total_strings
+
+        # Update the 'comp' values in languages_data
+        for language_code, stats in completeness_percentages.items():
+            total_strings = stats['total_strings']
+            translated_strings = stats['translated_strings']
+            completeness_percentage = (translated_strings / total_strings) * 100 if total_strings else 0
+
+            # Round the completeness percentage to two decimal places
+            completeness_percentage = round(completeness_percentage, 2)
+
+            # If the percentage is a whole number, convert it to int
+            if completeness_percentage.is_integer():
+                completeness_percentage = int(completeness_percentage)
+            if language_code in languages_data:
+                old_comp = languages_data[language_code].get('comp', None)
+                languages_data[language_code]['comp'] = completeness_percentage
+                if old_comp != completeness_percentage:
+                    languages_json_changed = True
+                    print(f"Updated {language_code} completeness to {completeness_percentage}%")
+            else:
+                print(f"ERROR: Language {language_code} not found in languages.json")
+
+        # Save the updated languages.json file if changes were made
+        if languages_json_changed:
+            with open(languages_json_path, 'w', encoding='utf-8') as f:
+                json.dump(languages_data, f, indent=4, ensure_ascii=False)
+            if not args.no_stage:
+                # Stage languages.json for commit
+                subprocess.run(['git', 'add', languages_json_path])
+                print(f"Staged {languages_json_path} for commit")
+            else:
+                print(f"Updated {languages_json_path} (not staged)")
+    elif args.skip_completeness:
+        print("\nSkipped completeness percentage update (--skip-completeness).")
+    elif args.dry_run:
+        print("\n[DRY RUN] Would update completeness percentages in languages.json.")
+    return languages_json_changed
+
+
+def report_and_commit(updated_languages, languages_json_changed):
+    if updated_languages or languages_json_changed:
+        updated_language_codes = sorted(updated_languages)
+        languages_str = ', '.join(updated_language_codes)
+
+        if updated_language_codes and languages_json_changed:
+            commit_message = f"Update translations ({languages_str}) and completeness from Transifex"
+        elif updated_language_codes:
+            commit_message = f"Update translations ({languages_str}) from Transifex"
         else:
-            print(f"ERROR: Language {language_code} not found in languages.json")
-
-    # Save the updated languages.json file if changes were made
-    if languages_json_changed:
-        with open(languages_json_path, 'w', encoding='utf-8') as f:
-            json.dump(languages_data, f, indent=4, ensure_ascii=False)
-        if not args.no_stage:
-            # Stage languages.json for commit
-            subprocess.run(['git', 'add', languages_json_path])
-            print(f"Staged {languages_json_path} for commit")
+            commit_message = "Update translation completeness from Transifex"
+
+        print("\nThe following languages have been updated:")
+        if updated_language_codes:
+            print(languages_str)
+        if languages_json_changed:
+            print("languages.json has been updated with new completeness percentages.")
+        print(f"\nCommit message: '{commit_message}'")
+
+        if args.dry_run:
+            print("\n[DRY RUN] No files were written or committed.")
+        elif args.no_stage:
+            print("\nFiles have been written but NOT staged. You can review with 'git diff'.")
+        elif args.no_commit:
+            print("\nChanges have been staged but NOT committed. Review with 'git diff --cached'.")
         else:
-            print(f"Updated {languages_json_path} (not staged)")
-elif args.skip_completeness:
-    print("\nSkipped completeness percentage update (--skip-completeness).")
-elif args.dry_run:
-    print("\n[DRY RUN] Would update completeness percentages in languages.json.")
-
-# --- Summary and commit ---
-if updated_languages or languages_json_changed:
-    updated_language_codes = sorted(updated_languages)
-    languages_str = ', '.join(updated_language_codes)
-
-    if updated_language_codes and languages_json_changed:
-        commit_message = f"Update translations ({languages_str}) and completeness from Transifex"
-    elif updated_language_codes:
-        commit_message = f"Update translations ({languages_str}) from Transifex"
+            should_commit = args.assume_yes
+            if not should_commit:
+                # Ask the user to review and confirm the commit
+                user_input = input("\nWould you like to commit these changes? (y/n): ").strip().lower()
+                should_commit = user_input == 'y'
+            else:
+                print("\nAuto-confirm enabled (--assume-yes). Committing changes...")
+
+            if should_commit:
+                author_info = 'transifex-translation-updater-bot <submittertech@gmail.com>'
+                subprocess.run(['git', 'commit', '--author', author_info, '-m', commit_message])
+                print("\nChanges have been committed.")
+            else:
+                # Revert the staging of the files
+                subprocess.run(['git', 'reset', 'HEAD'])
+                print("\nStaged changes have been reverted.")
     else:
-        commit_message = "Update translation completeness from Transifex"
+        print("\nNo changes detected in the translation files or languages.json.")
 
-    print("\nThe following languages have been updated:")
-    if updated_language_codes:
-        print(languages_str)
-    if languages_json_changed:
-        print("languages.json has been updated with new completeness percentages.")
-    print(f"\nCommit message: '{commit_message}'")
 
-    if args.dry_run:
-        print("\n[DRY RUN] No files were written or committed.")
-    elif args.no_stage:
-        print("\nFiles have been written but NOT staged. You can review with 'git diff'.")
-    elif args.no_commit:
-        print("\nChanges have been staged but NOT committed. Review with 'git diff --cached'.")
-    else:
-        should_commit = args.assume_yes
-        if not should_commit:
-            # Ask the user to review and confirm the commit
-            user_input = input("\nWould you like to commit these changes? (y/n): ").strip().lower()
-            should_commit = user_input == 'y'
-        else:
-            print("\nAuto-confirm enabled (--assume-yes). Committing changes...")
+def pull(argv=None, collect_raw_maps=False):
+    """
+    Run a full pull with command-line style arguments and return a structured result.
 
-        if should_commit:
-            author_info = 'transifex-translation-updater-bot <submittertech@gmail.com>'
-            subprocess.run(['git', 'commit', '--author', author_info, '-m', commit_message])
-            print("\nChanges have been committed.")
-        else:
-            # Revert the staging of the files
-            subprocess.run(['git', 'reset', 'HEAD'])
-            print("\nStaged changes have been reverted.")
-else:
-    print("\nNo changes detected in the translation files or languages.json.")
+    With collect_raw_maps=True the parsed raw mapjson payloads are also returned in
+    memory (keyed by language code), so callers such as prepare_map_update.py can use
+    them directly instead of reading them back from --raw-map-output-dir.
+    """
+    global collected_raw_maps, fingerprints
+    started = time.perf_counter()
+    configure(parse_args(argv))
+    if should_log('debug'):
+        imports = ", ".join(f"{name} {elapsed * 1000:.1f} ms" for name, elapsed in import_timings.items())
+        print(f"Startup took {(time.perf_counter() - started) * 1000:.1f} ms (imports: {imports or 'none'})")
+    collected_raw_maps = {} if collect_raw_maps else None
+    fingerprints = load_fingerprints()
+
+    download_poller = DownloadJobPoller(args.poll_interval, args.poll_max_interval)
+    try:
+        saved_languages = run_download_tasks(skip_unchanged_tasks(build_download_tasks()), download_poller)
+    finally:
+        save_fingerprints()
+    print_poll_stats(download_poller)
+
+    updated_languages = stage_updated_languages(saved_languages)
+    languages_json_changed = update_completeness()
+    report_and_commit(updated_languages, languages_json_changed)
+
+    raw_maps = collected_raw_maps
+    collected_raw_maps = None
+    return {
+        'languages': list(language_codes),
+        'saved_languages': sorted(saved_languages),
+        'updated_languages': sorted(updated_languages),
+        'languages_json_changed': languages_json_changed,
+        'poll_stats': download_poller.stats(),
+        'raw_maps': raw_maps,
+    }
+
+
+def main():
+    pull()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,46 @@
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF_FACTOR = 0.5
+DEFAULT_POOL_SIZE = 4
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+def build_session(retries=DEFAULT_RETRIES, backoff_factor=DEFAULT_BACKOFF_FACTOR, pool_size=DEFAULT_POOL_SIZE):
+    """
+    Build a requests session for export file downloads.
+
+    Connections are kept alive and pooled per host. At most pool_size connections are
+    opened to one host; extra requests wait for a free connection instead of opening
+    more. Connection errors and retryable HTTP statuses are retried with exponential
+    backoff, and a Retry-After header from the server is honored.
+    """
+    retry = Retry(
+        total=retries,
+        connect=retries,
+        read=retries,
+        status=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset(["GET", "HEAD"]),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        pool_block=True,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def is_transient_error(exc):
+    """True for connection-level failures that are worth retrying from the start of the body."""
+    return isinstance(exc, (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError))